@@ -2,19 +2,93 @@
 Debug panel to display real-time information about application operations.
 """
 
+import html
 import json
 import logging
+import queue
 import time
+from collections import deque
+from functools import partial
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QTextEdit, QPushButton, QLabel,
     QCheckBox, QHBoxLayout, QSplitter
 )
-from PyQt6.QtCore import Qt, pyqtSlot, QSize
-from PyQt6.QtGui import QColor, QTextCursor, QFont
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer
+from PyQt6.QtGui import QTextCursor, QFont
+
+from utils import compact_qss
+
+# Colors used for log lines, keyed by level
+LEVEL_COLORS = {
+    "error": "#ef5350",  # Red
+    "debug": "#9c9c9c",  # Gray
+}
+DEFAULT_COLOR = "#dcdcdc"  # Light gray
+DATA_INDICATOR_COLOR = "#64b5f6"  # Light blue
+
+# How long to wait for further messages before repainting (ms)
+FLUSH_INTERVAL_MS = 50
+
+# Stylesheet for the whole panel, applied once in setup_ui
+DEBUG_PANEL_QSS = compact_qss("""
+    QWidget {
+        background-color: #1a1a1a;
+        color: #cccccc;
+    }
+    QLabel#debugTitle {
+        font-weight: bold;
+        font-size: 14px;
+        color: #cccccc;
+    }
+    QPushButton {
+        background-color: #333333;
+        color: #ffffff;
+        padding: 4px 8px;
+        border: none;
+        border-radius: 4px;
+    }
+    QTextEdit {
+        background-color: #1a1a1a;
+        color: #cccccc;
+        font-family: monospace;
+        font-size: 12px;
+        border: none;
+    }
+""")
+
+# Largest formatted data payload shown in the details panel
+MAX_DETAILS_CHARS = 65536
+
+# Most messages moved from the queue into the log per flush
+MAX_DRAIN_PER_FLUSH = 200
+
+
+class DebugLogHandler(logging.Handler):
+    """Logging handler that forwards records to a DebugPanel.
+
+    Safe to call from any thread: records are only queued here and are
+    rendered by the panel on the GUI thread.
+    """
+
+    def __init__(self, enqueue, level=logging.NOTSET):
+        super().__init__(level)
+        self._enqueue = enqueue
+
+    def emit(self, record):
+        try:
+            self._enqueue((
+                time.strftime("%H:%M:%S", time.localtime(record.created)),
+                self.format(record),
+                record.levelname.lower(),
+                getattr(record, "data", None)
+            ))
+        except Exception:
+            self.handleError(record)
 
 
 class DebugPanel(QWidget):
     """Debug panel that shows real-time logs and network operations."""
+    flushRequested = pyqtSignal()  # First message queued since the last flush
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -22,12 +96,39 @@ class DebugPanel(QWidget):
         # Set up logger
         self.logger = logging.getLogger(__name__)
 
+        self.max_messages = 1000  # Limit messages to avoid memory issues
+
         # Create UI
         self.setup_ui()
 
-        # Initialize counters
-        self.message_count = 0
-        self.max_messages = 1000  # Limit messages to avoid memory issues
+        # Rendered lines; the deque drops the oldest once full
+        self._ring = deque(maxlen=self.max_messages)
+
+        # Rendered lines not yet added to the log view
+        self._unrendered = []
+
+        # Messages waiting for the next flush; filled from any thread
+        self._pending = queue.SimpleQueue()
+        self._flush_scheduled = False  # Flush timer requested or running
+        self._log_dirty = False
+
+        # Most recent data payload; formatted only when the details are shown
+        self._last_data = None
+        self._details_dirty = False
+
+        # Batch repaints so a burst of messages costs one document update;
+        # the timer only runs while messages are waiting
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(FLUSH_INTERVAL_MS)
+        self._flush_timer.setSingleShot(False)
+        self._flush_timer.timeout.connect(self._flush)
+        self.flushRequested.connect(self._flush_timer.start, Qt.ConnectionType.QueuedConnection)
+
+        # Route application logging into the panel
+        self.log_handler = DebugLogHandler(self._enqueue)
+        logging.getLogger().addHandler(self.log_handler)
+        # The root logger outlives the panel; bind the handler, not self
+        self.destroyed.connect(partial(logging.getLogger().removeHandler, self.log_handler))
 
     def setup_ui(self):
         """Set up the debug panel UI."""
@@ -42,11 +143,7 @@ class DebugPanel(QWidget):
         header_layout.setContentsMargins(8, 8, 8, 8)
 
         title = QLabel("Debug Console")
-        title.setStyleSheet("""
-            font-weight: bold;
-            font-size: 14px;
-            color: #cccccc;
-        """)
+        title.setObjectName("debugTitle")
         header_layout.addWidget(title)
 
         # Auto-scroll checkbox
@@ -56,15 +153,14 @@ class DebugPanel(QWidget):
 
         header_layout.addStretch(1)
 
+        # Details toggle button
+        self.details_btn = QPushButton("Details")
+        self.details_btn.setCheckable(True)
+        self.details_btn.toggled.connect(self.toggle_details)
+        header_layout.addWidget(self.details_btn)
+
         # Clear button
         clear_btn = QPushButton("Clear")
-        clear_btn.setStyleSheet("""
-            background-color: #333333;
-            color: #ffffff;
-            padding: 4px 8px;
-            border: none;
-            border-radius: 4px;
-        """)
         clear_btn.clicked.connect(self.clear_log)
         header_layout.addWidget(clear_btn)
 
@@ -77,25 +173,13 @@ class DebugPanel(QWidget):
         # Log text area
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.setStyleSheet("""
-            background-color: #1a1a1a;
-            color: #cccccc;
-            font-family: monospace;
-            font-size: 12px;
-            border: none;
-        """)
+        # One block per message; Qt drops the oldest blocks past the limit
+        self.log_text.document().setMaximumBlockCount(self.max_messages)
         splitter.addWidget(self.log_text)
 
         # Details text area
         self.details_text = QTextEdit()
         self.details_text.setReadOnly(True)
-        self.details_text.setStyleSheet("""
-            background-color: #1a1a1a;
-            color: #cccccc;
-            font-family: monospace;
-            font-size: 12px;
-            border: none;
-        """)
         self.details_text.setMaximumHeight(200)
         self.details_text.setVisible(False)  # Hidden initially
         splitter.addWidget(self.details_text)
@@ -105,97 +189,172 @@ class DebugPanel(QWidget):
 
         layout.addWidget(splitter, 1)
 
-        # Set the background color
-        self.setStyleSheet("""
-            background-color: #1a1a1a;
-            color: #cccccc;
-        """)
+        # Apply all panel styling in one pass
+        self.setStyleSheet(DEBUG_PANEL_QSS)
 
     def format_data(self, data):
-        """Format data for display."""
+        """Format data for display, capped at MAX_DETAILS_CHARS."""
         if not data:
             return ""
 
-        if isinstance(data, dict) or isinstance(data, list):
+        if isinstance(data, str):
+            text = data
+        elif isinstance(data, (bytes, bytearray)):
+            text = data.decode("utf-8", "replace")
+        elif isinstance(data, (dict, list)):
             try:
-                return json.dumps(data, indent=2)
-            except:
-                return str(data)
-        return str(data)
+                text = json.dumps(data, indent=2, ensure_ascii=False, default=str)
+            except ValueError:  # Circular reference
+                text = str(data)
+        else:
+            text = str(data)
+
+        if len(text) > MAX_DETAILS_CHARS:
+            text = text[:MAX_DETAILS_CHARS] + "\n...<truncated>..."
+        return text
 
     @pyqtSlot(str, str, object)
     def add_message(self, message, level="info", data=None):
         """Add a message to the debug log.
 
+        Safe to call from any thread. The message is queued and the log view
+        is repainted on the next flush so bursts of messages are drawn together.
+
         Args:
             message: Message text
             level: Log level (info, error, debug)
             data: Optional data object to display in details
         """
-        # Create formatted message with proper time handling
-        current_time = time.localtime()
-        time_str = time.strftime("%H:%M:%S", current_time)
-
-        # Color based on level
-        if level == "error":
-            color = QColor(239, 83, 80)  # Red
-        elif level == "debug":
-            color = QColor(156, 156, 156)  # Gray
-        else:
-            color = QColor(220, 220, 220)  # Light gray
+        self._enqueue((time.strftime("%H:%M:%S"), message, level, data))
 
-        # Add message to log
-        self.log_text.setTextColor(color)
+    def _enqueue(self, entry):
+        """Queue a message and start the flush timer if it is idle. Any thread."""
+        self._pending.put_nowait(entry)
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.flushRequested.emit()
 
+    def _render_line(self, time_str, message, level, data):
+        """Render a queued message as an HTML line."""
         prefix = f"[{time_str}] "
 
         # Add level indicator for non-info messages
         if level != "info":
             prefix += f"[{level.upper()}] "
 
-        # Add the message
-        self.log_text.append(f"{prefix}{message}")
+        color = LEVEL_COLORS.get(level, DEFAULT_COLOR)
+        text = html.escape(f"{prefix}{message}").replace("\n", "<br>")
+        line = f'<span style="color: {color};">{text}</span>'
 
-        # If data provided, add indication and store it
+        # If data provided, add indication and keep it for the details panel
         if data:
-            # Show a data indicator
-            self.log_text.setTextColor(QColor(100, 181, 246))  # Light blue
-            self.log_text.insertPlainText(" [+]")
-
-            # Show data in details panel
-            self.details_text.clear()
-            self.details_text.setTextColor(QColor(200, 200, 200))
-
-            formatted_data = self.format_data(data)
-            self.details_text.setText(formatted_data)
+            line += f'<span style="color: {DATA_INDICATOR_COLOR};"> [+]</span>'
+            self._last_data = data
+            self._details_dirty = True
 
-            # Make details visible
-            self.details_text.setVisible(True)
+        return line
 
-        # Auto-scroll if enabled
+    def _flush(self):
+        """Render pending messages in a single document update."""
+        drained = 0
+        while drained < MAX_DRAIN_PER_FLUSH:
+            try:
+                entry = self._pending.get_nowait()
+            except queue.Empty:
+                break
+            line = self._render_line(*entry)
+            self._ring.append(line)
+            self._unrendered.append(line)
+            drained += 1
+
+        # Go idle once the queue is empty; re-check after clearing the flag
+        # so a message queued in between still gets flushed
+        if self._pending.empty():
+            self._flush_timer.stop()
+            self._flush_scheduled = False
+            if not self._pending.empty():
+                self._flush_scheduled = True
+                self._flush_timer.start()
+
+        # Hidden panels keep collecting; the view is rebuilt when shown
+        if not self.isVisible():
+            if drained:
+                self._log_dirty = True
+                self._unrendered.clear()
+            return
+
+        if self._log_dirty:
+            self._render_log()
+        elif self._unrendered:
+            self._append_lines(self._unrendered)
+            self._unrendered.clear()
+            self._scroll_to_end()
+
+        if self._details_dirty and self.details_text.isVisible():
+            self._render_details()
+
+    def _render_log(self):
+        """Replace the log view with the contents of the ring buffer."""
+        self.log_text.clear()
+        self._append_lines(self._ring)
+        self._unrendered.clear()
+        self._log_dirty = False
+        self._scroll_to_end()
+
+    def _append_lines(self, lines):
+        """Append rendered lines to the log view, one block per line."""
+        document = self.log_text.document()
+        cursor = QTextCursor(document)
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        cursor.beginEditBlock()
+        for line in lines:
+            if not document.isEmpty():
+                cursor.insertBlock()
+            cursor.insertHtml(line)
+        cursor.endEditBlock()
+
+    def _scroll_to_end(self):
+        """Scroll the log view to the newest message if auto-scroll is on."""
         if self.auto_scroll.isChecked():
             scrollbar = self.log_text.verticalScrollBar()
             scrollbar.setValue(scrollbar.maximum())
 
-        # Increment counter and check if we need to trim
-        self.message_count += 1
-        if self.message_count > self.max_messages:
-            # Remove the oldest half of messages
-            cursor = self.log_text.textCursor()
-            cursor.movePosition(QTextCursor.MoveOperation.Start)
-            cursor.movePosition(
-                QTextCursor.MoveOperation.Down,
-                QTextCursor.MoveMode.KeepAnchor,
-                self.max_messages // 2
-            )
-            cursor.removeSelectedText()
-            self.message_count = self.max_messages // 2
+    def showEvent(self, event):
+        """Bring the log view up to date when the panel is shown."""
+        super().showEvent(event)
+        if self._log_dirty:
+            self._render_log()
+
+    def closeEvent(self, event):
+        """Stop routing application logging into a closed panel."""
+        logging.getLogger().removeHandler(self.log_handler)
+        super().closeEvent(event)
+
+    def toggle_details(self, checked):
+        """Show or hide the details panel."""
+        self.details_text.setVisible(checked)
+        if checked and self._details_dirty:
+            self._render_details()
+
+    def _render_details(self):
+        """Format the most recent data payload into the details panel."""
+        self.details_text.setPlainText(self.format_data(self._last_data))
+        self._details_dirty = False
 
     def clear_log(self):
         """Clear the debug log."""
+        try:
+            while True:
+                self._pending.get_nowait()
+        except queue.Empty:
+            pass
+        self._log_dirty = False
+        self._unrendered.clear()
+        self._last_data = None
+        self._details_dirty = False
+        self._ring.clear()
         self.log_text.clear()
         self.details_text.clear()
-        self.message_count = 0
 
     def set_font_size(self, size):
         """Change the font size."""
@@ -4,28 +4,51 @@ Worker thread for downloading books in the background.
 import os
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 from PyQt6.QtCore import QObject, pyqtSignal
 
+# Characters that are invalid in filenames on common filesystems
+_FNAME_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+# Leading/trailing characters stripped from filenames
+_INVALID_STRIP = ' \t\n\r.'
+
+# Default number of books downloaded at the same time; kept below the
+# portal's connection pool size
+MAX_CONCURRENT_DOWNLOADS = 4
+
+# Minimum time between progress signals for a single book (~30 Hz, seconds)
+PROGRESS_EMIT_INTERVAL = 0.033
+
 
 class DownloadWorker(QObject):
     """Worker thread to download books in the background."""
-    downloadStarted = pyqtSignal(str)  # book_id
+    downloadStartedBatch = pyqtSignal(list)  # book_ids
     downloadProgress = pyqtSignal(str, int)  # book_id, progress percentage
     downloadComplete = pyqtSignal(str, str)  # book_id, local file path
     downloadError = pyqtSignal(str, str)  # book_id, error message
+    downloadErrorBatch = pyqtSignal(list)  # [(book_id, error message)]
     loginRequired = pyqtSignal()
     finished = pyqtSignal()
     
-    def __init__(self, books, portal, output_folder, username="", password=""):
+    def __init__(self, books, portal, output_folder, username="", password="",
+                 max_workers=MAX_CONCURRENT_DOWNLOADS):
         super().__init__()
         self.books = books  # Dict of book_id: {download_url, title, etc}
         self.portal = portal
         self.output_folder = output_folder
+        # Normalised once so per-book paths are a plain concatenation
+        self._out_dir = os.path.normpath(os.fspath(output_folder)) + os.sep
         self.username = username
         self.password = password
+        self.max_workers = max_workers
         self.logger = logging.getLogger(__name__)
         self.cancel_flag = False
+
+        # book_id: (last emit time, last emitted progress), used for throttling
+        self._last_emit = {}
         
     def cancel(self):
         """Set cancel flag to stop processing."""
@@ -35,24 +58,25 @@ class DownloadWorker(QObject):
     def download(self):
         """Download books to the output folder."""
         try:
-            # Update portal credentials
-            self.portal.username = self.username
-            self.portal.password = self.password
+            # Update portal credentials if they changed
+            if self.portal.username != self.username or self.portal.password != self.password:
+                self.portal.username = self.username
+                self.portal.password = self.password
 
             # First try logging in if credentials provided
             if self.username and self.password and not self.portal.is_logged_in:
-                self.logger.info(f"Attempting login with username: {self.username}")
+                self.logger.info("Attempting login with username: %s", self.username)
                 start_time = time.time()
                 success = self.portal.login()
                 elapsed = time.time() - start_time
 
                 if not success:
-                    self.logger.error(f"Login failed in download worker (took {elapsed:.2f}s)")
+                    self.logger.error("Login failed in download worker (took %.2fs)", elapsed)
                     self.loginRequired.emit()
                     self.finished.emit()
                     return
                 else:
-                    self.logger.info(f"Login successful in download worker (took {elapsed:.2f}s)")
+                    self.logger.info("Login successful in download worker (took %.2fs)", elapsed)
             elif not self.username or not self.password:
                 self.logger.warning("Missing credentials for login")
                 self.loginRequired.emit()
@@ -61,105 +85,161 @@ class DownloadWorker(QObject):
             elif self.portal.is_logged_in:
                 self.logger.info("Already logged in, proceeding with download")
 
-            # Ensure output folder exists
-            os.makedirs(self.output_folder, exist_ok=True)
-            self.logger.info(f"Output folder: {self.output_folder}")
+            # Ensure output folder exists; done once per run on a worker thread
+            Path(self._out_dir).mkdir(parents=True, exist_ok=True)
+            self.logger.info("Output folder: %s", self.output_folder)
 
-            # Process each book
+            # Split off books that cannot be downloaded before any network work
+            jobs = []
+            invalid = []
+            used_paths = set()  # Lowercased, for case-insensitive filesystems
             for book_id, book_info in self.books.items():
-                if self.cancel_flag:
-                    self.logger.info("Download cancelled")
-                    break
-
-                self.logger.info(f"Starting download for book ID: {book_id}")
-                self.downloadStarted.emit(book_id)
-
-                try:
-                    # Get required info from book_info
-                    download_url = book_info.get("download_url", "")
-                    title = book_info.get("title", "Unknown")
-                    author = book_info.get("author", "Unknown")
-                    ebook_id = book_info.get("ebook_id", "")
-
-                    # Log book details
-                    self.logger.info(f"Book details - Title: {title}, Author: {author}")
-                    self.logger.info(f"Download URL: {download_url}")
-
-                    if not download_url:
-                        self.logger.error(f"No download URL available for book: {title}")
-                        raise ValueError("No download URL available")
-
-                    # Create a clean filename
-                    if author:
-                        filename = f"{author} - {title}"
-                    else:
-                        filename = title
-
-                    filename = self._clean_filename(filename)
-                    output_path = os.path.join(self.output_folder, filename)
-
-                    self.logger.info(f"Downloading book to: {output_path}")
-
-                    # Download the book
-                    start_time = time.time()
-                    result = self.portal.download_book(
-                        download_url,
-                        ebook_id,
-                        output_path,
-                        callback=lambda received, total: self._handle_progress(book_id, received, total)
-                    )
-                    elapsed = time.time() - start_time
-
-                    if result["success"]:
-                        # Emit completion signal
-                        self.logger.info(f"Download complete: {result['file_path']} (took {elapsed:.2f}s)")
-                        self.downloadComplete.emit(book_id, result["file_path"])
-                    else:
-                        # Emit error signal
-                        self.logger.error(f"Download failed: {result.get('message', 'Unknown error')} (took {elapsed:.2f}s)")
-                        self.downloadError.emit(book_id, result.get("message", "Download failed"))
-
-                except Exception as e:
-                    self.logger.exception(f"Error downloading book {book_id}: {str(e)}")
-                    self.downloadError.emit(book_id, str(e))
+                if book_info.get("download_url"):
+                    jobs.append((book_id, book_info, self._unique_path(self._output_path(book_info), used_paths)))
+                else:
+                    self.logger.error("No download URL available for book: %s",
+                                      book_info.get("title", "Unknown"))
+                    invalid.append((book_id, "No download URL available"))
 
-        except Exception as e:
-            self.logger.exception(f"Error in download worker: {str(e)}")
+            if invalid:
+                self.downloadErrorBatch.emit(invalid)
+
+            if not jobs:
+                return
+
+            # Mark every book as started in one cross-thread signal
+            self.downloadStartedBatch.emit([job[0] for job in jobs])
+
+            # Downloads are independent, so overlap them on a small pool
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(jobs)))) as executor:
+                futures = []
+                for job in jobs:
+                    if self.cancel_flag:
+                        break
+                    futures.append(executor.submit(self._download_one, *job))
+
+                for future in as_completed(futures):
+                    if self.cancel_flag:
+                        self.logger.info("Download cancelled")
+                        for pending in futures:
+                            pending.cancel()
+                        break
+
+        except Exception:
+            self.logger.exception("Error in download worker")
         finally:
             self.logger.info("Download worker finished")
             self.finished.emit()
 
+    def _output_path(self, book_info):
+        """Build the output path for a book from its author and title."""
+        title = book_info.get("title", "Unknown")
+        author = book_info.get("author", "Unknown")
+
+        # Create a clean filename
+        if author:
+            filename = f"{author} - {title}"
+        else:
+            filename = title
+
+        return self._out_dir + self._clean_filename(filename)
+
+    def _unique_path(self, output_path, used_paths):
+        """Return output_path, numbered " (2)", " (3)"... if this run already uses it.
+
+        Parallel downloads to one path would interleave into a corrupt file.
+        """
+        base, ext = os.path.splitext(output_path)
+        candidate = output_path
+        number = 2
+        while candidate.lower() in used_paths:
+            candidate = f"{base} ({number}){ext}"
+            number += 1
+        used_paths.add(candidate.lower())
+        return candidate
+
+    def _download_one(self, book_id, book_info, output_path):
+        """Download a single validated book. Runs on a pool thread."""
+        if self.cancel_flag:
+            return
+
+        self.logger.info("Starting download for book ID: %s", book_id)
+
+        try:
+            download_url = book_info["download_url"]
+            ebook_id = book_info.get("ebook_id", "")
+
+            # Log book details
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Book details - Title: %s, Author: %s",
+                                  book_info.get("title", "Unknown"), book_info.get("author", "Unknown"))
+                self.logger.debug("Download URL: %s", download_url)
+
+            self.logger.info("Downloading book to: %s", output_path)
+
+            # Download the book
+            start_time = time.time()
+            result = self.portal.download_book(
+                download_url,
+                ebook_id,
+                output_path,
+                callback=partial(self._handle_progress, book_id)
+            )
+            elapsed = time.time() - start_time
+
+            if result["success"]:
+                # Emit completion signal
+                self.logger.info("Download complete: %s (took %.2fs)", result["file_path"], elapsed)
+                self.downloadComplete.emit(book_id, result["file_path"])
+            else:
+                # Emit error signal
+                self.logger.error("Download failed: %s (took %.2fs)",
+                                  result.get("message", "Unknown error"), elapsed)
+                self.downloadError.emit(book_id, result.get("message", "Download failed"))
+
+        except Exception as e:
+            self.logger.exception("Error downloading book %s", book_id)
+            self.downloadError.emit(book_id, str(e))
+
     def _handle_progress(self, book_id, received, total):
-        """Handle download progress updates."""
-        if total > 0 and not self.cancel_flag:
-            progress = int((received / total) * 100)
+        """Handle download progress updates.
 
-            # Only emit progress updates on significant changes to reduce overhead
-            if progress % 5 == 0:  # Every 5%
-                self.downloadProgress.emit(book_id, progress)
-                self.logger.debug(f"Download progress for {book_id}: {progress}% ({received}/{total} bytes)")
+        Emits at most one signal per percentage step and no more often than
+        PROGRESS_EMIT_INTERVAL, except for the final 100% update.
+        """
+        if total <= 0 or self.cancel_flag:
+            return
+
+        progress = (received * 100) // total
+        now = time.monotonic()
+        last_time, last_progress = self._last_emit.get(book_id, (0, None))
+        if progress == last_progress:
+            return
+        if progress < 100 and now - last_time < PROGRESS_EMIT_INTERVAL:
+            return
+
+        self._last_emit[book_id] = (now, progress)
+        self.downloadProgress.emit(book_id, progress)
 
     def _clean_filename(self, filename):
         """Clean a filename to make it safe for all filesystems."""
-        # Replace invalid chars with underscores
-        invalid_chars = r'<>:"/\|?*'
-        for char in invalid_chars:
-            filename = filename.replace(char, '_')
-
-        # Limit length (255 is safe for most filesystems)
-        if len(filename) > 200:
+        # Replace invalid chars with underscores and remove leading/trailing
+        # whitespace and periods; fall back to a default if nothing is left
+        filename = filename.translate(_FNAME_TRANS).strip(_INVALID_STRIP) or "ebook"
+
+        # Split off the extension once; only short suffixes after a dot are
+        # treated as extensions, otherwise default to .pdf. A dot early in the
+        # title is not an extension: "Dr. Seuss - Green Eggs" becomes
+        # "Dr. Seuss - Green Eggs.pdf", not "Dr. Seuss - Green Eggs"
+        if '.' in filename[-6:]:
             base, ext = os.path.splitext(filename)
-            filename = base[:200 - len(ext)] + ext
+        else:
+            base, ext = filename, ""
+        if not ext:
+            base, ext = filename, ".pdf"
 
-        # Remove leading/trailing whitespace and periods
-        filename = filename.strip().strip('.')
-
-        # If empty after cleaning, provide a default
-        if not filename:
-            filename = "ebook"
-
-        # Add .pdf extension if no extension present
-        if not os.path.splitext(filename)[1]:
-            filename += ".pdf"
+        # Limit length (255 is safe for most filesystems)
+        if len(base) + len(ext) > 200:
+            base = base[:200 - len(ext)].rstrip(_INVALID_STRIP) or "ebook"
 
-        return filename
\ No newline at end of file
+        return base + ext
@@ -3,23 +3,87 @@ Worker thread for searching books in the background.
 """
 import time
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from PyQt6.QtCore import QObject, pyqtSignal
 
+# Default number of concurrent portal searches
+MAX_SEARCH_WORKERS = 8
+
+# Search result cache limits
+SEARCH_CACHE_SIZE = 512
+SEARCH_CACHE_TTL = 120  # seconds
+
+# Searches faster than this are not worth caching (seconds)
+SEARCH_CACHE_MIN_ELAPSED = 0.05
+
+
+class _SearchCache:
+    """Thread-safe LRU cache of search results with a time-to-live."""
+
+    def __init__(self, maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key: (timestamp, result)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        """Return a copy of the cached result for key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            timestamp, result = entry
+            if time.monotonic() - timestamp > self.ttl:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return dict(result)
+
+    def put(self, key, result):
+        """Store a copy of result under key, evicting the oldest entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), dict(result))
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached results."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Return (hits, misses, size) counted since the cache was created."""
+        with self._lock:
+            return self.hits, self.misses, len(self._entries)
+
+
+_search_cache = _SearchCache()
+
 
 class SearchWorker(QObject):
     """Worker thread to search for books in the background."""
-    searchStarted = pyqtSignal(str)  # book_id
+    searchStartedBatch = pyqtSignal(list)  # book_ids
     searchResult = pyqtSignal(str, dict)  # book_id, results
     searchError = pyqtSignal(str, str)  # book_id, error message
     loginRequired = pyqtSignal()
     finished = pyqtSignal()
     
-    def __init__(self, books, portal, username="", password=""):
+    def __init__(self, books, portal, username="", password="",
+                 max_workers=MAX_SEARCH_WORKERS):
         super().__init__()
         self.books = books  # List of dicts with 'id', 'title', 'author'
         self.portal = portal
         self.username = username
         self.password = password
+        self.max_workers = max_workers
         self.logger = logging.getLogger(__name__)
         self.cancel_flag = False
         
@@ -28,19 +92,25 @@ class SearchWorker(QObject):
         self.cancel_flag = True
         self.logger.info("Search cancellation requested")
 
+    @classmethod
+    def invalidate_cache(cls):
+        """Drop all cached search results, e.g. after a login change."""
+        _search_cache.clear()
+
     def search(self):
         """Search for books on the library portal."""
         try:
-            # Update portal credentials
-            self.portal.username = self.username
-            self.portal.password = self.password
+            # Update portal credentials if they changed
+            if self.portal.username != self.username or self.portal.password != self.password:
+                self.portal.username = self.username
+                self.portal.password = self.password
 
             # If empty book list, just verify login and return
             if not self.books:
                 self.logger.info("No books to search, just verifying login")
                 # First try logging in if credentials provided
                 if self.username and self.password and not self.portal.is_logged_in:
-                    self.logger.info(f"Attempting login verification with username: {self.username}")
+                    self.logger.info("Attempting login verification with username: %s", self.username)
                     success = self.portal.login()
                     if not success:
                         self.logger.error("Login verification failed")
@@ -53,18 +123,18 @@ class SearchWorker(QObject):
 
             # First try logging in if credentials provided
             if self.username and self.password and not self.portal.is_logged_in:
-                self.logger.info(f"Attempting login with username: {self.username}")
+                self.logger.info("Attempting login with username: %s", self.username)
                 start_time = time.time()
                 success = self.portal.login()
                 elapsed = time.time() - start_time
 
                 if not success:
-                    self.logger.error(f"Login failed in search worker (took {elapsed:.2f}s)")
+                    self.logger.error("Login failed in search worker (took %.2fs)", elapsed)
                     self.loginRequired.emit()
                     self.finished.emit()
                     return
                 else:
-                    self.logger.info(f"Login successful in search worker (took {elapsed:.2f}s)")
+                    self.logger.info("Login successful in search worker (took %.2fs)", elapsed)
             elif not self.username or not self.password:
                 self.logger.warning("Missing credentials for login")
                 self.loginRequired.emit()
@@ -73,34 +143,63 @@ class SearchWorker(QObject):
             elif self.portal.is_logged_in:
                 self.logger.info("Already logged in, proceeding with search")
 
-            # Process each book
-            for book in self.books:
-                if self.cancel_flag:
-                    self.logger.info("Search cancelled")
-                    break
+            # Mark every book as queued up front in one cross-thread signal
+            self.searchStartedBatch.emit([book["id"] for book in self.books])
 
-                book_id = book["id"]
-                self.logger.info(f"Searching for book: {book['title']} by {book['author']}")
-                self.searchStarted.emit(book_id)
+            # Searches are independent network round-trips, so run them concurrently
+            with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(self.books)))) as executor:
+                futures = {}
+                for book in self.books:
+                    if self.cancel_flag:
+                        break
+                    futures[executor.submit(self._search_one, book)] = book
 
-                try:
-                    # Search for this book using the portal
-                    start_time = time.time()
-                    result = self.portal.search_book(book["title"], book["author"])
-                    elapsed = time.time() - start_time
+                for future in as_completed(futures):
+                    if self.cancel_flag:
+                        self.logger.info("Search cancelled")
+                        for pending in futures:
+                            pending.cancel()
+                        break
 
-                    # Add book_id to result for reference
-                    result["book_id"] = book_id
+                    book_id = futures[future]["id"]
+                    try:
+                        result = future.result()
+                        self.searchResult.emit(book_id, result)
+                    except Exception as e:
+                        self.logger.exception("Error searching for book %s", book_id)
+                        self.searchError.emit(book_id, str(e))
 
-                    self.logger.info(f"Search result for {book_id}: {result.get('status', 'Unknown')} (took {elapsed:.2f}s)")
-                    self.searchResult.emit(book_id, result)
+        except Exception:
+            self.logger.exception("Error in search worker")
+        finally:
+            self.logger.info("Search worker finished (cache: %d hits, %d misses, %d entries)",
+                             *_search_cache.stats())
+            self.finished.emit()
 
-                except Exception as e:
-                    self.logger.exception(f"Error searching for book {book_id}: {str(e)}")
-                    self.searchError.emit(book_id, str(e))
+    def _search_one(self, book):
+        """Search the portal for a single book. Runs on a pool thread."""
+        book_id = book["id"]
+        cache_key = (book["title"].lower().strip(), book["author"].lower().strip())
 
-        except Exception as e:
-            self.logger.exception(f"Error in search worker: {str(e)}")
-        finally:
-            self.logger.info("Search worker finished")
-            self.finished.emit()
\ No newline at end of file
+        result = _search_cache.get(cache_key)
+        if result is not None:
+            self.logger.info("Using cached search result for %s", book_id)
+            result["book_id"] = book_id
+            return result
+
+        self.logger.info("Searching for book: %s by %s", book["title"], book["author"])
+
+        start_time = time.monotonic()
+        result = self.portal.search_book(book["title"], book["author"])
+        elapsed = time.monotonic() - start_time
+
+        # Only keep definitive answers from searches slow enough to matter
+        if result.get("status") != "Error" and elapsed > SEARCH_CACHE_MIN_ELAPSED:
+            _search_cache.put(cache_key, result)
+
+        # Add book_id to result for reference
+        result["book_id"] = book_id
+
+        self.logger.info("Search result for %s: %s (took %.2fs)",
+                         book_id, result.get("status", "Unknown"), elapsed)
+        return result
\ No newline at end of file
@@ -11,6 +11,7 @@ from pathlib import Path
 import re
 import time
 import urllib.parse
+from collections import deque
 from typing import Dict, List, Optional, Tuple
 
 # Import PyQt components first
@@ -18,7 +19,7 @@ from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout,
     QHBoxLayout, QLabel, QPushButton, QFileDialog,
     QFrame, QScrollArea, QLineEdit, QSplitter,
-    QComboBox, QCheckBox, QTextEdit, QDialog,
+    QComboBox, QCheckBox, QPlainTextEdit, QDialog,
     QDialogButtonBox, QProgressBar, QStackedWidget,
     QMessageBox
 )
@@ -27,18 +28,14 @@ from PyQt6.QtGui import (
     QCursor, QPainter, QColor, QPixmap, QIcon
 )
 from PyQt6.QtCore import (
-    Qt, QThread, pyqtSignal, QObject, QSize, QPoint,
-    QPropertyAnimation, QEasingCurve, QVariantAnimation,
+    Qt, QThreadPool, QRunnable, pyqtSignal, QObject, QSize, QPoint,
+    QPropertyAnimation,
     pyqtProperty, QTimer, QUrl
 )
-from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
-
-# Import keyring for credential storage
-import keyring
 
 # Import our custom modules
 from settings import Settings
-from utils import setup_logging, generate_book_id, clean_filename, parse_book_list
+from utils import setup_logging, generate_book_id, clean_filename, parse_book_list, compact_qss
 from library_manager import EbookCentralPortal
 from DebugPanel import DebugPanel
 from SearchWorker import SearchWorker
@@ -51,6 +48,7 @@ class ElegantFrame(QFrame):
     def __init__(self, parent=None, radius=12, bg_color="#1a1a1a", shadow=True, border=False, border_color=None, border_style="solid"):
         super().__init__(parent)
         self.radius = radius
+        self._shadow_qcolor = QColor(0, 0, 0, 20)
         self.bg_color = bg_color
         self.has_shadow = shadow
         self.has_border = border
@@ -62,7 +60,37 @@ class ElegantFrame(QFrame):
         """)
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
-    def paintEvent(self, event):
+        # Pick the paint path once; frames without shadow or border only fill
+        self.paintEvent = self._paint_full if shadow or border else self._paint_plain
+
+    @property
+    def bg_color(self):
+        return self._bg_color
+
+    @bg_color.setter
+    def bg_color(self, color):
+        # Keep a parsed QColor so painting does not rebuild it
+        self._bg_color = color
+        self._bg_qcolor = QColor(color)
+
+    @property
+    def border_color(self):
+        return self._border_color
+
+    @border_color.setter
+    def border_color(self, color):
+        self._border_color = color
+        self._border_qcolor = QColor(color)
+
+    def _paint_plain(self, event):
+        """Paint only the rounded background."""
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(self._bg_qcolor)
+        painter.drawRoundedRect(self.rect(), self.radius, self.radius)
+
+    def _paint_full(self, event):
         """Custom paint event to draw rounded corners and shadows."""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -70,30 +98,79 @@ class ElegantFrame(QFrame):
         # Draw shadow if enabled
         if self.has_shadow:
             painter.setPen(Qt.PenStyle.NoPen)
-            painter.setBrush(QColor(0, 0, 0, 20))
+            painter.setBrush(self._shadow_qcolor)
             painter.drawRoundedRect(self.rect().adjusted(2, 2, -2, -2), self.radius, self.radius)
 
         # Draw main background
         painter.setPen(Qt.PenStyle.NoPen)
-        painter.setBrush(QColor(self.bg_color))
+        painter.setBrush(self._bg_qcolor)
         painter.drawRoundedRect(self.rect(), self.radius, self.radius)
 
         # Draw border if enabled
         if self.has_border:
             if self.border_style == "dashed":
                 pen = painter.pen()
-                pen.setColor(QColor(self.border_color))
+                pen.setColor(self._border_qcolor)
                 pen.setStyle(Qt.PenStyle.DashLine)
                 pen.setWidth(1)
                 painter.setPen(pen)
                 painter.setBrush(Qt.BrushStyle.NoBrush)
                 painter.drawRoundedRect(self.rect().adjusted(1, 1, -1, -1), self.radius, self.radius)
             else:
-                painter.setPen(QColor(self.border_color))
+                painter.setPen(self._border_qcolor)
                 painter.setBrush(Qt.BrushStyle.NoBrush)
                 painter.drawRoundedRect(self.rect().adjusted(0, 0, -1, -1), self.radius, self.radius)
 
 
+# Tick interval of the shared button animation timer (~60 fps)
+ANIMATION_INTERVAL_MS = 16
+
+
+class AnimationManager(QObject):
+    """Drives the press animations of all AnimatedButtons from a single timer."""
+
+    def __init__(self):
+        super().__init__()
+        self._active = {}  # button: (start, end, start_time, duration)
+        self._timer = QTimer(self)
+        self._timer.setInterval(ANIMATION_INTERVAL_MS)
+        self._timer.timeout.connect(self._tick)
+
+    def animate(self, button, start, end, duration_ms=75):
+        """Animate a button's animation_progress from start to end."""
+        self._active[button] = (start, end, time.monotonic(), duration_ms / 1000)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _tick(self):
+        """Advance every running animation with an OutCubic easing."""
+        now = time.monotonic()
+        for button, (start, end, start_time, duration) in list(self._active.items()):
+            t = min((now - start_time) / duration, 1.0)
+            eased = 1.0 - (1.0 - t) ** 3
+            try:
+                button.animation_progress = start + (end - start) * eased
+            except RuntimeError:
+                # The button was deleted mid-animation
+                t = 1.0
+            if t >= 1.0:
+                del self._active[button]
+
+        if not self._active:
+            self._timer.stop()
+
+
+_animation_manager = None
+
+
+def get_animation_manager():
+    """Return the shared AnimationManager, creating it on first use."""
+    global _animation_manager
+    if _animation_manager is None:
+        _animation_manager = AnimationManager()
+    return _animation_manager
+
+
 class AnimatedButton(QPushButton):
     """Base class for buttons with smooth macOS-like animation."""
 
@@ -102,11 +179,8 @@ class AnimatedButton(QPushButton):
         self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
 
         # Animation properties
+        # Progress is driven by the shared AnimationManager (75ms, OutCubic)
         self._animation_progress = 0.0
-        self._animation = QVariantAnimation()
-        self._animation.setDuration(75)  # 75ms animation
-        self._animation.setEasingCurve(QEasingCurve.Type.OutCubic)  # macOS-like easing
-        self._animation.valueChanged.connect(self._update_animation)
 
         # Keep track of mouse state
         self._is_pressed = False
@@ -135,10 +209,6 @@ class AnimatedButton(QPushButton):
     # Define animation property
     animation_progress = pyqtProperty(float, _get_animation_progress, _set_animation_progress)
 
-    def _update_animation(self, value):
-        """Update animation state."""
-        self.animation_progress = value
-
     def enterEvent(self, event):
         """Handle mouse enter event."""
         self._is_hovered = True
@@ -157,10 +227,7 @@ class AnimatedButton(QPushButton):
             self._is_pressed = True
 
             # Start animation from 0 to 1
-            self._animation.stop()
-            self._animation.setStartValue(0.0)
-            self._animation.setEndValue(1.0)
-            self._animation.start()
+            get_animation_manager().animate(self, 0.0, 1.0)
 
         super().mousePressEvent(event)
 
@@ -170,10 +237,7 @@ class AnimatedButton(QPushButton):
             self._is_pressed = False
 
             # Start animation from current value back to 0
-            self._animation.stop()
-            self._animation.setStartValue(self._animation_progress)
-            self._animation.setEndValue(0.0)
-            self._animation.start()
+            get_animation_manager().animate(self, self._animation_progress, 0.0)
 
         super().mouseReleaseEvent(event)
 
@@ -196,6 +260,13 @@ class ElegantButton(AnimatedButton):
             self.hover_color = "#2a2a2a"
             self.pressed_color = "#101010"  # Darker for press animation
 
+        # Parse colors once so painting does no string work
+        self._normal_qcolor = QColor(self.normal_color)
+        self._hover_qcolor = QColor(self.hover_color)
+        self._normal_rgb = self._normal_qcolor.getRgb()[:3]
+        self._hover_rgb = self._hover_qcolor.getRgb()[:3]
+        self._pressed_rgb = QColor(self.pressed_color).getRgb()[:3]
+
         # Set font weight
         if primary:
             self.setStyleSheet("""
@@ -219,17 +290,16 @@ class ElegantButton(AnimatedButton):
         if self._is_pressed or self._animation_progress > 0:
             # Animate between normal/hover color and pressed color based on animation progress
             if self._is_hovered and not self._is_pressed:
-                base_color = self.hover_color
+                base_rgb = self._hover_rgb
             else:
-                base_color = self.normal_color
+                base_rgb = self._normal_rgb
 
             # Mix colors based on animation progress
-            color = self._mix_colors(base_color, self.pressed_color, self._animation_progress)
-            painter.setBrush(QColor(color))
+            painter.setBrush(self._mix_rgb(base_rgb, self._pressed_rgb, self._animation_progress))
         elif self._is_hovered:
-            painter.setBrush(QColor(self.hover_color))
+            painter.setBrush(self._hover_qcolor)
         else:
-            painter.setBrush(QColor(self.normal_color))
+            painter.setBrush(self._normal_qcolor)
 
         painter.setPen(Qt.PenStyle.NoPen)
         painter.drawRoundedRect(self.rect(), 8, 8)
@@ -237,16 +307,36 @@ class ElegantButton(AnimatedButton):
         # Pass to standard button painting for text/icon
         super(AnimatedButton, self).paintEvent(event)
 
-    def _mix_colors(self, color1, color2, factor):
-        """Mix two hex colors based on factor (0-1)."""
-        r1, g1, b1 = int(color1[1:3], 16), int(color1[3:5], 16), int(color1[5:7], 16)
-        r2, g2, b2 = int(color2[1:3], 16), int(color2[3:5], 16), int(color2[5:7], 16)
+    def _mix_rgb(self, rgb1, rgb2, factor):
+        """Mix two (r, g, b) tuples based on factor (0-1)."""
+        r1, g1, b1 = rgb1
+        r2, g2, b2 = rgb2
+
+        return QColor(
+            int(r1 + factor * (r2 - r1)),
+            int(g1 + factor * (g2 - g1)),
+            int(b1 + factor * (b2 - b1))
+        )
 
-        r = int(r1 + factor * (r2 - r1))
-        g = int(g1 + factor * (g2 - g1))
-        b = int(b1 + factor * (b2 - b1))
 
-        return f"#{r:02x}{g:02x}{b:02x}"
+# BookCard status label text, stylesheet and card background for each status
+STATUS_QSS_TEMPLATE = """
+    color: {};
+    font-size: 12px;
+    font-weight: {};
+    background-color: transparent;
+"""
+STATUS_STYLES = {
+    status: (text, compact_qss(STATUS_QSS_TEMPLATE.format(fg, "600" if bold else "normal")), bg)
+    for status, text, fg, bg, bold in (
+        ("Searching", "Searching...", "#0078d4", "#1a2a3a", False),
+        ("Found", "Found", "#2fcc71", "#1a291f", False),
+        ("Not Found", "Not Found", "#e74c3c", "#2a1a1a", False),
+        ("Error", "Error", "#e74c3c", "#2a1a1a", False),
+        ("Downloaded", "Downloaded", "#2fcc71", "#1a3a1f", True),
+        ("Downloading", "Downloading...", "#3498db", "#1a2a3a", False),
+    )
+}
 
 
 class BookCard(QWidget):
@@ -257,18 +347,41 @@ class BookCard(QWidget):
 
     def __init__(self, book_info, parent=None):
         super().__init__(parent)
+        # The card shares the app's book record rather than copying its fields
         self.book_info = book_info
-        self.title = book_info.get("title", "Unknown Title")
-        self.author = book_info.get("author", "Unknown Author")
-        self.status = "Waiting"  # Initial status
-        self.download_url = book_info.get("download_url", "")
-        self.view_url = book_info.get("view_url", "")
-        self.format = book_info.get("format", "")
+        book_info.setdefault("status", "Waiting")  # Initial status
 
         self.setup_ui()
 
+    @property
+    def title(self):
+        return self.book_info.get("title", "Unknown Title")
+
+    @property
+    def author(self):
+        return self.book_info.get("author", "Unknown Author")
+
+    @property
+    def format(self):
+        return self.book_info.get("format", "")
+
+    @property
+    def download_url(self):
+        return self.book_info.get("download_url", "")
+
+    @property
+    def view_url(self):
+        return self.book_info.get("view_url", "")
+
+    @property
+    def status(self):
+        return self.book_info["status"]
+
     def setup_ui(self):
         """Set up the book card UI."""
+        # Font metrics used for eliding the title
+        self._fm = QFontMetrics(self.font())
+
         # Main layout with larger margins for cleaner look
         layout = QHBoxLayout(self)
         layout.setContentsMargins(12, 8, 12, 8)
@@ -322,6 +435,7 @@ class BookCard(QWidget):
             background-color: transparent;
         """)
         self.title_label.setToolTip(self.title)
+        self._shown_title = self.title  # Title the label currently displays
         details_layout.addWidget(self.title_label)
 
         # Author line
@@ -376,111 +490,154 @@ class BookCard(QWidget):
 
     def _truncate_text(self, text, max_width):
         """Truncate text to fit in the available width."""
-        metrics = QFontMetrics(self.font())
-        if metrics.horizontalAdvance(text) <= max_width:
-            return text
-
-        # Truncate the middle
-        while metrics.horizontalAdvance(text[:-3] + "...") > max_width and len(text) > 10:
-            text = text[:-1]
-
-        return text[:-3] + "..."
+        return self._fm.elidedText(text, Qt.TextElideMode.ElideRight, max_width)
 
     def update_status(self, status, message=""):
         """Update status with optional message."""
-        self.status = status
+        self.book_info["status"] = status
 
-        # Update status label and styling based on status
-        if status == "Searching":
-            self.status_label.setText("Searching...")
-            self.status_label.setStyleSheet("""
-                color: #0078d4;
-                font-size: 12px;
-                background-color: transparent;
-            """)
-            self.bg_frame.bg_color = "#1a2a3a"
+        style = STATUS_STYLES.get(status)
+        if style is None:
+            return
 
-        elif status == "Found":
-            self.status_label.setText("Found")
-            self.status_label.setStyleSheet("""
-                color: #2fcc71;
-                font-size: 12px;
-                background-color: transparent;
-            """)
-            self.bg_frame.bg_color = "#1a291f"
+        # Update status label and styling based on status
+        text, qss, bg_color = style
+        self.status_label.setText(text)
+        self.status_label.setStyleSheet(qss)
+        self.bg_frame.bg_color = bg_color
 
+        if status == "Found":
             # Enable buttons if URLs are available
             self.view_btn.setEnabled(bool(self.view_url))
             self.download_btn.setEnabled(bool(self.download_url))
-
-        elif status == "Not Found":
-            self.status_label.setText("Not Found")
-            self.status_label.setStyleSheet("""
-                color: #e74c3c;
-                font-size: 12px;
-                background-color: transparent;
-            """)
-            self.bg_frame.bg_color = "#2a1a1a"
-
         elif status == "Error":
-            self.status_label.setText("Error")
-            self.status_label.setStyleSheet("""
-                color: #e74c3c;
-                font-size: 12px;
-                background-color: transparent;
-            """)
-            self.bg_frame.bg_color = "#2a1a1a"
             self.status_label.setToolTip(message)
 
-        elif status == "Downloaded":
-            self.status_label.setText("Downloaded")
-            self.status_label.setStyleSheet("""
-                color: #2fcc71;
-                font-size: 12px;
-                font-weight: 600;
-                background-color: transparent;
-            """)
-            self.bg_frame.bg_color = "#1a3a1f"
-
-        elif status == "Downloading":
-            self.status_label.setText("Downloading...")
-            self.status_label.setStyleSheet("""
-                color: #3498db;
-                font-size: 12px;
-                background-color: transparent;
-            """)
-            self.bg_frame.bg_color = "#1a2a3a"
-
         self.bg_frame.update()
 
     def update_details(self, details):
         """Update book details with new information."""
-        # Update book info
+        # Update book info (a no-op when the app already updated the shared record)
         self.book_info.update(details)
 
-        # Update display elements
-        if "title" in details:
-            self.title = details["title"]
+        # The title width is fixed, so only re-elide when the displayed text changes;
+        # the shared record may already hold the new title, so compare with the label
+        if self.title != self._shown_title:
+            self._shown_title = self.title
             self.title_label.setText(self._truncate_text(self.title, 250))
             self.title_label.setToolTip(self.title)
 
         if "author" in details:
-            self.author = details["author"]
             self.author_label.setText(self.author)
 
         if "format" in details:
-            self.format = details["format"]
             self.format_label.setText(self.format[:3] if self.format else "?")
 
         if "download_url" in details:
-            self.download_url = details["download_url"]
             self.download_btn.setEnabled(bool(self.download_url))
 
         if "view_url" in details:
-            self.view_url = details["view_url"]
             self.view_btn.setEnabled(bool(self.view_url))
 
 
+# Window-level stylesheet shared by the main window and its dialogs
+APP_QSS = compact_qss("""
+    QMainWindow, QWidget {
+        background-color: #121212;
+        color: #ffffff;
+        font-family: Arial, sans-serif;
+    }
+    QScrollBar:vertical {
+        border: none;
+        background: #1e1e1e;
+        width: 6px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background: #555555;
+        min-height: 20px;
+        border-radius: 3px;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        border: none;
+        background: none;
+        height: 0px;
+    }
+    QSplitter::handle {
+        background-color: #2a2a2a;
+        width: 1px;
+    }
+    QLineEdit, QTextEdit, QPlainTextEdit, QComboBox {
+        background-color: #1e1e1e;
+        color: #ffffff;
+        border: none;
+        border-radius: 6px;
+        padding: 6px;
+        font-size: 13px;
+    }
+    QComboBox::drop-down {
+        border: none;
+        padding-right: 6px;
+    }
+    QLabel#panelHeader {
+        color: #ffffff;
+        font-size: 15px;
+        font-weight: 600;
+        margin-bottom: 4px;
+    }
+    QLabel#caption, QCheckBox {
+        color: #aaaaaa;
+        font-size: 13px;
+    }
+    QLabel#searchStatus {
+        color: #0078d4;
+        font-size: 13px;
+        font-style: italic;
+    }
+    QLabel#folderPath {
+        color: #ffffff;
+        font-size: 13px;
+        padding: 4px 8px;
+        background-color: #1e1e1e;
+        border-radius: 6px;
+    }
+    QLabel#emptyResults {
+        color: #888888;
+        font-size: 14px;
+        padding: 20px;
+        qproperty-alignment: AlignCenter;
+    }
+    QPlainTextEdit#booksInput {
+        padding: 8px;
+    }
+    QLabel#dialogTitle {
+        color: #ffffff;
+        font-size: 18px;
+        font-weight: 600;
+    }
+    QLabel#sectionHeader {
+        color: #ffffff;
+        font-size: 15px;
+        font-weight: 600;
+    }
+    QLineEdit#dialogField {
+        padding: 8px;
+        font-size: 14px;
+    }
+    QLabel#connectionStatus {
+        color: #888888;
+        font-size: 13px;
+        min-height: 20px;
+        margin-top: 8px;
+    }
+    QLabel#aboutLabel {
+        color: #888888;
+        font-size: 12px;
+        margin-top: 8px;
+    }
+""")
+
+
 class LoginDialog(QDialog):
     """Elegant login dialog for library portal."""
 
@@ -489,14 +646,9 @@ class LoginDialog(QDialog):
         self.setWindowTitle("Login to Ridley Library")
         self.resize(400, 320)
 
-        # Set dialog style - darker theme
-        self.setStyleSheet("""
-            QDialog, QWidget {
-                background-color: #121212;
-                color: #ffffff;
-                font-family: Arial, sans-serif;
-            }
-        """)
+        # Styling comes from the parent window's stylesheet (APP_QSS)
+        if parent is None:
+            self.setStyleSheet(APP_QSS)
 
         self.setup_ui(first_run)
 
@@ -509,24 +661,16 @@ class LoginDialog(QDialog):
         # Title with welcome message for first run
         if first_run:
             title_label = QLabel("Welcome to Ridley Library Assistant")
-            title_label.setStyleSheet("""
-                color: #ffffff;
-                font-size: 18px;
-                font-weight: 600;
-            """)
+            title_label.setObjectName("dialogTitle")
             layout.addWidget(title_label)
 
             intro_text = QLabel("Please enter your Ridley College login credentials to access the library resources.")
             intro_text.setWordWrap(True)
-            intro_text.setStyleSheet("color: #aaaaaa; font-size: 13px;")
+            intro_text.setObjectName("caption")
             layout.addWidget(intro_text)
         else:
             title_label = QLabel("Ridley Library Login")
-            title_label.setStyleSheet("""
-                color: #ffffff;
-                font-size: 18px;
-                font-weight: 600;
-            """)
+            title_label.setObjectName("dialogTitle")
             layout.addWidget(title_label)
 
         # Content frame
@@ -540,18 +684,11 @@ class LoginDialog(QDialog):
         username_layout.setSpacing(4)
 
         username_label = QLabel("Username")
-        username_label.setStyleSheet("color: #aaaaaa; font-size: 13px;")
+        username_label.setObjectName("caption")
         username_layout.addWidget(username_label)
 
         self.username_input = QLineEdit()
-        self.username_input.setStyleSheet("""
-            background-color: #1e1e1e;
-            color: #ffffff;
-            border: none;
-            border-radius: 6px;
-            padding: 8px;
-            font-size: 14px;
-        """)
+        self.username_input.setObjectName("dialogField")
         username_layout.addWidget(self.username_input)
 
         content_layout.addLayout(username_layout)
@@ -561,29 +698,18 @@ class LoginDialog(QDialog):
         password_layout.setSpacing(4)
 
         password_label = QLabel("Password")
-        password_label.setStyleSheet("color: #aaaaaa; font-size: 13px;")
+        password_label.setObjectName("caption")
         password_layout.addWidget(password_label)
 
         self.password_input = QLineEdit()
         self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        self.password_input.setStyleSheet("""
-            background-color: #1e1e1e;
-            color: #ffffff;
-            border: none;
-            border-radius: 6px;
-            padding: 8px;
-            font-size: 14px;
-        """)
+        self.password_input.setObjectName("dialogField")
         password_layout.addWidget(self.password_input)
 
         content_layout.addLayout(password_layout)
 
         # Remember me checkbox
         self.remember_checkbox = QCheckBox("Remember credentials")
-        self.remember_checkbox.setStyleSheet("""
-            color: #aaaaaa;
-            font-size: 13px;
-        """)
         self.remember_checkbox.setChecked(True)
         content_layout.addWidget(self.remember_checkbox)
 
@@ -612,29 +738,24 @@ class LoginDialog(QDialog):
 class SettingsDialog(QDialog):
     """Settings dialog for Library Assistant."""
 
-    def __init__(self, parent=None, username="", remember_credentials=True):
+    def __init__(self, parent=None, username="", remember_credentials=True, settings=None):
         super().__init__(parent)
         self.setWindowTitle("Settings")
         self.resize(400, 400)  # Make it taller for login status
 
-        # Set dialog style - darker theme
-        self.setStyleSheet("""
-            QDialog, QWidget {
-                background-color: #121212;
-                color: #ffffff;
-                font-family: Arial, sans-serif;
-            }
-        """)
+        # Styling comes from the parent window's stylesheet (APP_QSS)
+        if parent is None:
+            self.setStyleSheet(APP_QSS)
 
         self.username = username
         self.remember_credentials = remember_credentials
 
-        # Try to load password from keyring
+        # Try to load password from keyring (cached on the settings object)
         self.password = ""
-        if username:
+        if username and settings is not None:
             try:
-                self.password = keyring.get_password("LibraryAssistant", username) or ""
-            except:
+                self.password = settings.get_credential("password")
+            except Exception:
                 pass
 
         self.setup_ui()
@@ -647,11 +768,7 @@ class SettingsDialog(QDialog):
 
         # Title
         title_label = QLabel("Settings")
-        title_label.setStyleSheet("""
-            color: #ffffff;
-            font-size: 18px;
-            font-weight: 600;
-        """)
+        title_label.setObjectName("dialogTitle")
         layout.addWidget(title_label)
 
         # Account settings frame
@@ -662,11 +779,7 @@ class SettingsDialog(QDialog):
 
         # Account section header
         account_header = QLabel("Ridley Library Account")
-        account_header.setStyleSheet("""
-            color: #ffffff;
-            font-size: 15px;
-            font-weight: 600;
-        """)
+        account_header.setObjectName("sectionHeader")
         account_layout.addWidget(account_header)
 
         # Username field
@@ -674,19 +787,12 @@ class SettingsDialog(QDialog):
         username_layout.setSpacing(4)
 
         username_label = QLabel("Username")
-        username_label.setStyleSheet("color: #aaaaaa; font-size: 13px;")
+        username_label.setObjectName("caption")
         username_layout.addWidget(username_label)
 
         self.username_input = QLineEdit()
         self.username_input.setText(self.username)
-        self.username_input.setStyleSheet("""
-            background-color: #1e1e1e;
-            color: #ffffff;
-            border: none;
-            border-radius: 6px;
-            padding: 8px;
-            font-size: 14px;
-        """)
+        self.username_input.setObjectName("dialogField")
         username_layout.addWidget(self.username_input)
 
         account_layout.addLayout(username_layout)
@@ -696,52 +802,32 @@ class SettingsDialog(QDialog):
         password_layout.setSpacing(4)
 
         password_label = QLabel("Password")
-        password_label.setStyleSheet("color: #aaaaaa; font-size: 13px;")
+        password_label.setObjectName("caption")
         password_layout.addWidget(password_label)
 
         self.password_input = QLineEdit()
         self.password_input.setText(self.password)
         self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
-        self.password_input.setStyleSheet("""
-            background-color: #1e1e1e;
-            color: #ffffff;
-            border: none;
-            border-radius: 6px;
-            padding: 8px;
-            font-size: 14px;
-        """)
+        self.password_input.setObjectName("dialogField")
         password_layout.addWidget(self.password_input)
 
         account_layout.addLayout(password_layout)
 
         # Remember me checkbox
         self.remember_checkbox = QCheckBox("Remember credentials")
-        self.remember_checkbox.setStyleSheet("""
-            color: #aaaaaa;
-            font-size: 13px;
-        """)
         self.remember_checkbox.setChecked(self.remember_credentials)
         account_layout.addWidget(self.remember_checkbox)
 
         # Add connection status area
         self.login_status = QLabel("")
-        self.login_status.setStyleSheet("""
-            color: #888888;
-            font-size: 13px;
-            min-height: 20px;
-            margin-top: 8px;
-        """)
+        self.login_status.setObjectName("connectionStatus")
         account_layout.addWidget(self.login_status)
 
         layout.addWidget(account_frame)
 
         # About section
         about_label = QLabel("Ridley Library Assistant v1.0")
-        about_label.setStyleSheet("""
-            color: #888888;
-            font-size: 12px;
-            margin-top: 8px;
-        """)
+        about_label.setObjectName("aboutLabel")
         layout.addWidget(about_label)
 
         layout.addStretch(1)
@@ -764,6 +850,159 @@ class SettingsDialog(QDialog):
         layout.addLayout(self.button_layout)
 
 
+# "Title by Author" line format
+_BOOK_BY_RE = re.compile(r'(.*?)\s+by\s+(.*)', re.IGNORECASE)
+
+
+def parse_book_lines(text):
+    """Parse "Title by Author" lines into (title, author) tuples."""
+    entries = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+
+        # Try to parse "Title by Author" format; the substring test skips the regex on most lines
+        match = 'by' in line.lower() and _BOOK_BY_RE.match(line)
+        if match:
+            title = match.group(1).strip()
+            author = match.group(2).strip()
+        else:
+            # If no "by" found, assume the whole line is the title
+            title = line
+            author = ""
+
+        if title:
+            entries.append((title, author))
+
+    return entries
+
+
+# Book list files at least this large are read off the GUI thread
+LARGE_BOOK_FILE_BYTES = 1024 * 1024
+
+
+def read_book_file(file_path):
+    """Read a UTF-8 book list file."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+class BookFileLoadSignals(QObject):
+    """Signals for BookFileLoadTask."""
+    loaded = pyqtSignal(str, str)  # file path, text
+    failed = pyqtSignal(str, str)  # file path, error message
+
+
+class BookFileLoadTask(QRunnable):
+    """Reads a book list file on a QThreadPool thread."""
+
+    def __init__(self, file_path):
+        super().__init__()
+        self.file_path = file_path
+        self.signals = BookFileLoadSignals()
+
+    def run(self):
+        try:
+            text = read_book_file(self.file_path)
+        except Exception as e:
+            self.signals.failed.emit(self.file_path, str(e))
+            return
+        self.signals.loaded.emit(self.file_path, text)
+
+
+class BookParseSignals(QObject):
+    """Signals for BookParseTask."""
+    parsed = pyqtSignal(list)  # [(title, author)]
+
+
+class BookParseTask(QRunnable):
+    """Parses the book input text on a QThreadPool thread."""
+
+    def __init__(self, text):
+        super().__init__()
+        self.text = text
+        self.signals = BookParseSignals()
+
+    def run(self):
+        self.signals.parsed.emit(parse_book_lines(self.text))
+
+
+# Starting directory for file dialogs when no previous path is saved
+HOME_DIR = os.path.expanduser("~")
+
+# Result cards created per event-loop pass when a search starts
+CARD_BATCH_SIZE = 10
+
+# Threads kept for running the search, download and verification workers
+WORKER_POOL_SIZE = 4
+
+
+class WorkerTask(QRunnable):
+    """Runs a worker's entry point on a QThreadPool thread."""
+
+    def __init__(self, fn):
+        super().__init__()
+        self.fn = fn
+
+    def run(self):
+        self.fn()
+
+
+# Interval at which queued download progress is pushed to the book cards
+PROGRESS_FLUSH_INTERVAL_MS = 50
+
+
+class CredentialLoadSignals(QObject):
+    """Signals for CredentialLoadTask."""
+    loaded = pyqtSignal(str, str)  # username, password
+    failed = pyqtSignal(str)  # error message
+
+
+class CredentialLoadTask(QRunnable):
+    """Reads the saved credentials from the keyring on a QThreadPool thread."""
+
+    def __init__(self, settings):
+        super().__init__()
+        self.settings = settings
+        self.signals = CredentialLoadSignals()
+
+    def run(self):
+        try:
+            username = self.settings.get_credential("username")
+            password = self.settings.get_credential("password")
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.loaded.emit(username, password)
+
+
+class CredentialSaveSignals(QObject):
+    """Signals for CredentialSaveTask."""
+    saved = pyqtSignal(str)  # username
+    failed = pyqtSignal(str)  # error message
+
+
+class CredentialSaveTask(QRunnable):
+    """Writes credentials to the keyring on a QThreadPool thread."""
+
+    def __init__(self, settings, username, password):
+        super().__init__()
+        self.settings = settings
+        self.username = username
+        self.password = password
+        self.signals = CredentialSaveSignals()
+
+    def run(self):
+        try:
+            self.settings.set_credential("username", self.username)
+            self.settings.set_credential("password", self.password)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.saved.emit(self.username)
+
+
 class LibraryAssistantApp(QMainWindow):
     """Main application window for Library Assistant."""
 
@@ -773,6 +1012,8 @@ class LibraryAssistantApp(QMainWindow):
 
         # Book data
         self.books = {}  # Dict of book_id: book_info
+        self.book_cards = {}  # Dict of book_id: BookCard
+        self._downloadable = set()  # Book ids that are Found with a download URL
         self.next_book_id = 1
 
         # Login state
@@ -781,12 +1022,32 @@ class LibraryAssistantApp(QMainWindow):
         self.is_logged_in = False
 
         # Worker threads
+        # Worker objects stay on the GUI thread; their entry points run on a
+        # reused pool, so signals reach the window as queued connections
+        self.worker_pool = QThreadPool(self)
+        self.worker_pool.setMaxThreadCount(WORKER_POOL_SIZE)
         self.search_worker = None
-        self.search_thread = None
         self.download_worker = None
-        self.download_thread = None
-        self.verify_thread = None
         self.verify_worker = None
+        self.parse_task = None
+        self.credential_task = None
+        self.credential_save_task = None
+        self.file_load_task = None
+
+        # Result cards still to be created for the current search
+        self._pending_cards = deque()
+        self._pending_search = None
+        self._card_timer = QTimer(self)
+        self._card_timer.setInterval(0)
+        self._card_timer.timeout.connect(self._create_card_batch)
+
+        # Latest download progress per book, flushed to the cards by a timer
+        self._pending_progress = {}
+        self._shown_progress = {}
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(PROGRESS_FLUSH_INTERVAL_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
 
         # Logger
         self.logger = logging.getLogger(__name__)
@@ -794,8 +1055,9 @@ class LibraryAssistantApp(QMainWindow):
         # Debug panel reference
         self.debug_panel = None
 
-        # Create library portal instance with debug callback
-        self.portal = EbookCentralPortal(debug_callback=self.debug_callback)
+        # Create library portal instance; its log output reaches the debug
+        # panel through the panel's logging handler
+        self.portal = EbookCentralPortal()
 
         # Set up the UI
         self.setWindowTitle("Ridley Library Assistant")
@@ -803,46 +1065,8 @@ class LibraryAssistantApp(QMainWindow):
         self.setMinimumHeight(600)
         self.resize(1200, 800)  # Default size - larger for debug panel
 
-        # Set app style - darker theme
-        self.setStyleSheet("""
-            QMainWindow, QWidget {
-                background-color: #121212;
-                color: #ffffff;
-                font-family: Arial, sans-serif;
-            }
-            QScrollBar:vertical {
-                border: none;
-                background: #1e1e1e;
-                width: 6px;
-                margin: 0px;
-            }
-            QScrollBar::handle:vertical {
-                background: #555555;
-                min-height: 20px;
-                border-radius: 3px;
-            }
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                border: none;
-                background: none;
-                height: 0px;
-            }
-            QSplitter::handle {
-                background-color: #2a2a2a;
-                width: 1px;
-            }
-            QLineEdit, QTextEdit, QComboBox {
-                background-color: #1e1e1e;
-                color: #ffffff;
-                border: none;
-                border-radius: 6px;
-                padding: 6px;
-                font-size: 13px;
-            }
-            QComboBox::drop-down {
-                border: none;
-                padding-right: 6px;
-            }
-        """)
+        # Set app style - darker theme; dialogs inherit it as children
+        self.setStyleSheet(APP_QSS)
 
         # Check for first run and show login dialog if needed
         self.check_first_run()
@@ -850,27 +1074,58 @@ class LibraryAssistantApp(QMainWindow):
         # Setup the main UI
         self.setup_ui()
 
-        # Try to load credentials from keyring
+        # Load credentials from the keyring without blocking the first paint
         if self.settings.get("remember_credentials", True):
-            try:
-                self.username = keyring.get_password("LibraryAssistant", "username") or ""
-                self.password = keyring.get_password("LibraryAssistant", "password") or ""
+            self.credential_task = CredentialLoadTask(self.settings)
+            self.credential_task.signals.loaded.connect(self.on_credentials_loaded)
+            self.credential_task.signals.failed.connect(self.on_credentials_failed)
+            QThreadPool.globalInstance().start(self.credential_task)
 
-                if self.username and self.password:
-                    self.debug_callback(f"Loaded credentials for: {self.username}", "info")
+        # Enable drag and drop
+        self.setAcceptDrops(True)
 
-                    # Update the portal with credentials
-                    self.portal.username = self.username
-                    self.portal.password = self.password
+    def on_credentials_loaded(self, username, password):
+        """Apply credentials read from the keyring."""
+        self.credential_task = None
 
-                    # Try to verify login
-                    self.verify_credentials_async()
-            except Exception as e:
-                self.logger.warning(f"Failed to load credentials: {str(e)}")
-                self.debug_callback(f"Failed to load credentials: {str(e)}", "error")
+        # Credentials entered while the keyring was being read take precedence
+        if self.username:
+            return
 
-        # Enable drag and drop
-        self.setAcceptDrops(True)
+        self.username = username
+        self.password = password
+
+        if self.username and self.password:
+            self.debug_callback(f"Loaded credentials for: {self.username}", "info")
+
+            # Update the portal with credentials
+            self.portal.username = self.username
+            self.portal.password = self.password
+
+            # Try to verify login
+            self.verify_credentials_async()
+
+    def on_credentials_failed(self, error_message):
+        """Handle a keyring read failure."""
+        self.credential_task = None
+        self.logger.warning(f"Failed to load credentials: {error_message}")
+
+    def save_credentials_async(self):
+        """Write the current credentials to the keyring on a pool thread."""
+        self.credential_save_task = CredentialSaveTask(self.settings, self.username, self.password)
+        self.credential_save_task.signals.saved.connect(self.on_credentials_saved)
+        self.credential_save_task.signals.failed.connect(self.on_credentials_save_failed)
+        QThreadPool.globalInstance().start(self.credential_save_task)
+
+    def on_credentials_saved(self, username):
+        """Handle credentials written to the keyring."""
+        self.credential_save_task = None
+        self.debug_callback(f"Saved credentials for: {username}", "info")
+
+    def on_credentials_save_failed(self, error_message):
+        """Handle a keyring write failure."""
+        self.credential_save_task = None
+        self.logger.warning(f"Failed to save credentials: {error_message}")
 
     def debug_callback(self, message, level="info", data=None):
         """Callback for debug messages from library manager."""
@@ -879,26 +1134,19 @@ class LibraryAssistantApp(QMainWindow):
 
     def verify_credentials_async(self):
         """Verify credentials in a background thread."""
-        # Create a QThread for login verification
         self.debug_callback("Verifying credentials in background...", "info")
 
         # For simplicity, we'll reuse the search worker pattern
-        self.verify_thread = QThread()
-
         # Pass an empty book list - we just want to trigger login
         self.verify_worker = SearchWorker([], self.portal, self.username, self.password)
-        self.verify_worker.moveToThread(self.verify_thread)
 
         # Connect signals
-        self.verify_thread.started.connect(self.verify_worker.search)
         self.verify_worker.loginRequired.connect(self.on_login_required)
         self.verify_worker.finished.connect(self.on_verify_finished)
-        self.verify_worker.finished.connect(self.verify_thread.quit)
-        self.verify_thread.finished.connect(self.verify_worker.deleteLater)
-        self.verify_thread.finished.connect(self.verify_thread.deleteLater)
+        self.verify_worker.finished.connect(lambda: setattr(self, 'verify_worker', None))
 
-        # Start thread
-        self.verify_thread.start()
+        # Run on the worker pool
+        self.worker_pool.start(WorkerTask(self.verify_worker.search))
 
     def on_verify_finished(self):
         """Handle verification completion."""
@@ -942,29 +1190,18 @@ class LibraryAssistantApp(QMainWindow):
         left_layout.setSpacing(10)
 
         # Input panel header with login status
-        header_container = QWidget()
-        header_layout = QHBoxLayout(header_container)
+        header_layout = QHBoxLayout()
         header_layout.setContentsMargins(0, 0, 0, 0)
         header_layout.setSpacing(8)
 
         input_header = QLabel("Book Search")
-        input_header.setStyleSheet("""
-            color: #ffffff;
-            font-size: 15px;
-            font-weight: 600;
-            margin-bottom: 4px;
-        """)
+        input_header.setObjectName("panelHeader")
         header_layout.addWidget(input_header)
 
         header_layout.addStretch(1)
 
-        # Add login status display
+        # Add login status display (styled by update_login_status_display)
         self.login_status = QLabel()
-        self.login_status.setStyleSheet("""
-            color: #aaaaaa;
-            font-size: 12px;
-            font-style: italic;
-        """)
         header_layout.addWidget(self.login_status)
 
         # Settings button
@@ -977,7 +1214,7 @@ class LibraryAssistantApp(QMainWindow):
         self.debug_btn.clicked.connect(self.toggle_debug_panel)
         header_layout.addWidget(self.debug_btn)
 
-        left_layout.addWidget(header_container)
+        left_layout.addLayout(header_layout)
 
         # Input options container with frame
         input_frame = ElegantFrame(radius=10, bg_color="#171717")
@@ -988,31 +1225,19 @@ class LibraryAssistantApp(QMainWindow):
         # Text input for books
         input_frame_layout.addWidget(QLabel("Enter books (one per line, format: Title by Author):"))
 
-        self.books_input = QTextEdit()
-        self.books_input.setStyleSheet("""
-            background-color: #1e1e1e;
-            color: #ffffff;
-            border: none;
-            border-radius: 6px;
-            padding: 8px;
-            font-size: 13px;
-        """)
-        self.books_input.setAcceptRichText(False)
+        self.books_input = QPlainTextEdit()
+        self.books_input.setObjectName("booksInput")
         self.books_input.setPlaceholderText("The Great Gatsby by F. Scott Fitzgerald\nTo Kill a Mockingbird by Harper Lee")
         self.books_input.setMinimumHeight(150)
         input_frame_layout.addWidget(self.books_input)
 
         # Or import from file
-        import_container = QWidget()
-        import_layout = QHBoxLayout(import_container)
+        import_layout = QHBoxLayout()
         import_layout.setContentsMargins(0, 0, 0, 0)
         import_layout.setSpacing(8)
 
         import_label = QLabel("Or import from file:")
-        import_label.setStyleSheet("""
-            color: #aaaaaa;
-            font-size: 13px;
-        """)
+        import_label.setObjectName("caption")
         import_layout.addWidget(import_label)
 
         import_layout.addStretch(1)
@@ -1021,11 +1246,10 @@ class LibraryAssistantApp(QMainWindow):
         self.import_btn.clicked.connect(self.import_from_file)
         import_layout.addWidget(self.import_btn)
 
-        input_frame_layout.addWidget(import_container)
+        input_frame_layout.addLayout(import_layout)
 
         # Action buttons
-        buttons_container = QWidget()
-        buttons_layout = QHBoxLayout(buttons_container)
+        buttons_layout = QHBoxLayout()
         buttons_layout.setContentsMargins(0, 8, 0, 0)
         buttons_layout.setSpacing(8)
 
@@ -1037,11 +1261,7 @@ class LibraryAssistantApp(QMainWindow):
 
         # Add status indicator during search
         self.search_status = QLabel("")
-        self.search_status.setStyleSheet("""
-            color: #0078d4;
-            font-size: 13px;
-            font-style: italic;
-        """)
+        self.search_status.setObjectName("searchStatus")
         buttons_layout.addWidget(self.search_status)
         self.search_status.setVisible(False)
 
@@ -1049,40 +1269,31 @@ class LibraryAssistantApp(QMainWindow):
         self.search_btn.clicked.connect(self.start_search)
         buttons_layout.addWidget(self.search_btn)
 
-        input_frame_layout.addWidget(buttons_container)
+        input_frame_layout.addLayout(buttons_layout)
 
         left_layout.addWidget(input_frame)
 
         # Output folder display
-        output_container = QWidget()
-        output_layout = QHBoxLayout(output_container)
+        output_layout = QHBoxLayout()
         output_layout.setContentsMargins(0, 8, 0, 0)
         output_layout.setSpacing(8)
 
         output_label = QLabel("Downloads folder:")
-        output_label.setStyleSheet("""
-            color: #aaaaaa;
-            font-size: 13px;
-        """)
+        output_label.setObjectName("caption")
         output_layout.addWidget(output_label)
 
-        self.output_folder_label = QLabel(self.settings.get("output_folder"))
-        self.output_folder_label.setStyleSheet("""
-            color: #ffffff;
-            font-size: 13px;
-            padding: 4px 8px;
-            background-color: #1e1e1e;
-            border-radius: 6px;
-        """)
+        self.output_folder = self.settings.get("output_folder")
+        self.output_folder_label = QLabel(self.output_folder)
+        self.output_folder_label.setObjectName("folderPath")
         self.output_folder_label.setMinimumWidth(100)
-        self.output_folder_label.setToolTip(self.settings.get("output_folder"))
+        self.output_folder_label.setToolTip(self.output_folder)
         output_layout.addWidget(self.output_folder_label, 1)
 
         self.browse_output_btn = ElegantButton("Browse")
         self.browse_output_btn.clicked.connect(self.browse_output_folder)
         output_layout.addWidget(self.browse_output_btn)
 
-        left_layout.addWidget(output_container)
+        left_layout.addLayout(output_layout)
 
         # Right side - Results panel
         right_panel = QWidget()
@@ -1091,18 +1302,12 @@ class LibraryAssistantApp(QMainWindow):
         right_layout.setSpacing(10)
 
         # Results header with action buttons
-        results_header_container = QWidget()
-        results_header_layout = QHBoxLayout(results_header_container)
+        results_header_layout = QHBoxLayout()
         results_header_layout.setContentsMargins(0, 0, 0, 0)
         results_header_layout.setSpacing(8)
 
         results_header = QLabel("Results")
-        results_header.setStyleSheet("""
-            color: #ffffff;
-            font-size: 15px;
-            font-weight: 600;
-            margin-bottom: 4px;
-        """)
+        results_header.setObjectName("panelHeader")
         results_header_layout.addWidget(results_header)
 
         results_header_layout.addStretch(1)
@@ -1112,7 +1317,7 @@ class LibraryAssistantApp(QMainWindow):
         self.download_all_btn.setEnabled(False)
         results_header_layout.addWidget(self.download_all_btn)
 
-        right_layout.addWidget(results_header_container)
+        right_layout.addLayout(results_header_layout)
 
         # Results container with frame
         results_frame = ElegantFrame(radius=10, bg_color="#171717")
@@ -1136,12 +1341,7 @@ class LibraryAssistantApp(QMainWindow):
 
         # Empty state message
         self.empty_results_label = QLabel("No results yet. Enter books and click 'Search'.")
-        self.empty_results_label.setStyleSheet("""
-            color: #888888;
-            font-size: 14px;
-            padding: 20px;
-            qproperty-alignment: AlignCenter;
-        """)
+        self.empty_results_label.setObjectName("emptyResults")
         results_frame_layout.addWidget(self.empty_results_label)
 
         right_layout.addWidget(results_frame, 1)  # Stretch to fill
@@ -1255,11 +1455,10 @@ class LibraryAssistantApp(QMainWindow):
 
             # Save to keyring if remember is checked
             if remember:
-                try:
-                    keyring.set_password("LibraryAssistant", "username", self.username)
-                    keyring.set_password("LibraryAssistant", "password", self.password)
-                except Exception as e:
-                    self.logger.warning(f"Failed to save credentials: {str(e)}")
+                self.save_credentials_async()
+
+            # Cached search results may depend on the previous account
+            SearchWorker.invalidate_cache()
 
             # Update login status
             if self.username and self.password:
@@ -1270,7 +1469,8 @@ class LibraryAssistantApp(QMainWindow):
 
     def show_settings(self):
         """Show settings dialog."""
-        dialog = SettingsDialog(self, self.username, self.settings.get("remember_credentials", True))
+        dialog = SettingsDialog(self, self.username, self.settings.get("remember_credentials", True),
+                                self.settings)
 
         # Add Test Connection button
         test_btn = ElegantButton("Test Connection")
@@ -1289,17 +1489,12 @@ class LibraryAssistantApp(QMainWindow):
 
             # Save to keyring if remember is checked
             if remember:
-                try:
-                    keyring.set_password("LibraryAssistant", "username", self.username)
-                    keyring.set_password("LibraryAssistant", "password", self.password)
-                    self.debug_callback(f"Saved credentials for: {self.username}", "info")
-                except Exception as e:
-                    self.logger.warning(f"Failed to save credentials: {str(e)}")
-                    self.debug_callback(f"Failed to save credentials: {str(e)}", "error")
+                self.save_credentials_async()
 
             # Update portal
             self.portal.username = self.username
             self.portal.password = self.password
+            SearchWorker.invalidate_cache()
 
             # Test connection with new credentials
             self.verify_credentials_async()
@@ -1325,12 +1520,10 @@ class LibraryAssistantApp(QMainWindow):
             dialog.login_status.setStyleSheet("color: #3498db;")
             QApplication.processEvents()
 
-        # Create a temporary portal for the test
-        test_portal = EbookCentralPortal(username, password, self.debug_callback)
-
-        # Run test
+        # Run test on a temporary portal, releasing its connections afterwards
         self.debug_callback(f"Testing connection with username: {username}", "info")
-        result = test_portal.test_connection()
+        with EbookCentralPortal(username, password) as test_portal:
+            result = test_portal.test_connection()
 
         # Show result
         if result["success"]:
@@ -1351,8 +1544,9 @@ class LibraryAssistantApp(QMainWindow):
         file_path, _ = QFileDialog.getOpenFileName(
             self,
             "Select Book List File",
-            self.settings.get("last_file_path", os.path.expanduser("~")),
-            "Text Files (*.txt);;All Files (*.*)"
+            self.settings.get("last_file_path") or HOME_DIR,
+            "Text Files (*.txt);;All Files (*.*)",
+            options=self._file_dialog_options()
         )
 
         if file_path:
@@ -1361,37 +1555,81 @@ class LibraryAssistantApp(QMainWindow):
                 self.settings.set("last_file_path", os.path.dirname(file_path))
                 self.settings.save()
 
-                # Read file
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                # Update text input
-                self.books_input.setText(content)
-                self.debug_callback(f"Imported book list from: {file_path}", "info")
+                # Read file into the text input
+                if self.load_book_file(file_path):
+                    self.debug_callback(f"Imported book list from: {file_path}", "info")
 
             except Exception as e:
                 self.logger.error(f"Error importing file: {str(e)}")
-                self.debug_callback(f"Error importing file: {str(e)}", "error")
                 self.show_message("Import Error", f"Could not import file: {str(e)}")
 
+    def load_book_file(self, file_path):
+        """Replace the book input with the contents of a text file.
+
+        Large files are read on a pool thread and shown once loaded.
+
+        Returns:
+            bool: True if the input was filled now, False if loading continues
+            in the background
+        """
+        if os.path.getsize(file_path) < LARGE_BOOK_FILE_BYTES:
+            # Plain text: no rich-text detection or layout
+            self.books_input.setPlainText(read_book_file(file_path))
+            return True
+
+        self.debug_callback(f"Loading large book list in background: {file_path}", "info")
+        self.file_load_task = BookFileLoadTask(file_path)
+        self.file_load_task.signals.loaded.connect(self.on_book_file_loaded)
+        self.file_load_task.signals.failed.connect(self.on_book_file_failed)
+        QThreadPool.globalInstance().start(self.file_load_task)
+        return False
+
+    def on_book_file_loaded(self, file_path, text):
+        """Show a book list file read in the background."""
+        self.file_load_task = None
+        self.books_input.setPlainText(text)
+        self.debug_callback(f"Imported book list from: {file_path}", "info")
+
+    def on_book_file_failed(self, file_path, error_message):
+        """Handle a background book list read failure."""
+        self.file_load_task = None
+        self.logger.error(f"Error importing file: {error_message}")
+        self.show_message("Import Error", f"Could not import file: {error_message}")
+
     def clear_input(self):
         """Clear input fields."""
         self.books_input.clear()
         self.debug_callback("Cleared input", "info")
 
+    def _file_dialog_options(self, options=QFileDialog.Option(0)):
+        """Return file dialog options, honouring the use_native_dialogs setting.
+
+        Native dialogs can enumerate network shares synchronously and freeze
+        the UI on some systems; Qt's own dialog avoids that.
+        """
+        if not self.settings.get("use_native_dialogs", True):
+            options |= QFileDialog.Option.DontUseNativeDialog
+        return options
+
     def browse_output_folder(self):
         """Browse for output folder."""
         folder = QFileDialog.getExistingDirectory(
             self,
             "Select Download Folder",
-            self.settings.get("output_folder")
+            self.output_folder,
+            self._file_dialog_options(QFileDialog.Option.ShowDirsOnly)
         )
 
-        if folder:
+        # Nothing to save or re-layout if the folder did not change
+        if folder and folder != self.output_folder:
+            self.output_folder = folder
             self.settings.set("output_folder", folder)
             self.settings.save()
-            self.output_folder_label.setText(self._format_folder_path(folder))
+            # Tooltip first (no layout), then the text, as a single repaint
+            self.output_folder_label.setUpdatesEnabled(False)
             self.output_folder_label.setToolTip(folder)
+            self.output_folder_label.setText(self._format_folder_path(folder))
+            self.output_folder_label.setUpdatesEnabled(True)
             self.debug_callback(f"Selected output folder: {folder}", "info")
 
     def _format_folder_path(self, path, max_length=30):
@@ -1408,43 +1646,22 @@ class LibraryAssistantApp(QMainWindow):
         remaining = max_length - len(tail) - 5
         return head[:remaining] + "..." + os.path.sep + tail
 
-    def parse_books(self):
-        """Parse book input into structured data."""
-        text = self.books_input.toPlainText().strip()
-        if not text:
-            return []
-
+    def add_parsed_books(self, entries):
+        """Create book records for parsed (title, author) entries."""
         books = []
-        lines = text.split('\n')
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-
-            # Try to parse "Title by Author" format
-            match = re.search(r'(.*?)\s+by\s+(.*)', line, re.IGNORECASE)
-            if match:
-                title = match.group(1).strip()
-                author = match.group(2).strip()
-            else:
-                # If no "by" found, assume the whole line is the title
-                title = line
-                author = ""
-
-            if title:
-                book_id = f"book_{self.next_book_id}"
-                self.next_book_id += 1
-
-                book = {
-                    "id": book_id,
-                    "title": title,
-                    "author": author,
-                    "status": "Waiting"
-                }
+        for title, author in entries:
+            book_id = f"book_{self.next_book_id}"
+            self.next_book_id += 1
+
+            book = {
+                "id": book_id,
+                "title": title,
+                "author": author,
+                "status": "Waiting"
+            }
 
-                books.append(book)
-                self.books[book_id] = book
+            books.append(book)
+            self.books[book_id] = book
 
         return books
 
@@ -1460,12 +1677,12 @@ class LibraryAssistantApp(QMainWindow):
     def on_login_required(self):
         """Handle login required notification."""
         # Stop current search/download
-        if self.search_thread and self.search_thread.isRunning():
-            self.debug_callback("Cancelling search thread due to login requirement", "info")
+        if self.search_worker is not None:
+            self.debug_callback("Cancelling search due to login requirement", "info")
             self.search_worker.cancel()
 
-        if self.download_thread and self.download_thread.isRunning():
-            self.debug_callback("Cancelling download thread due to login requirement", "info")
+        if self.download_worker is not None:
+            self.debug_callback("Cancelling download due to login requirement", "info")
             self.download_worker.cancel()
 
         # Force login dialog (not settings)
@@ -1489,10 +1706,35 @@ class LibraryAssistantApp(QMainWindow):
         self.search_status.setVisible(False)
 
     def start_search(self):
-        """Start search process for parsed books."""
-        # Parse books
-        books = self.parse_books()
+        """Parse the book input on a pool thread, then start searching."""
+        text = self.books_input.toPlainText().strip()
+        if not text:
+            self.debug_callback("No books to search", "info")
+            self.show_message("No Books", "Please enter at least one book to search for")
+            return
+
+        if self.credential_task is not None:
+            self.show_message("Please Wait", "Saved credentials are still loading, please try again in a moment")
+            return
+
+        # Disable search button while parsing and searching
+        self.search_btn.setEnabled(False)
+        self.search_status.setText("Searching...")
+        self.search_status.setVisible(True)
+
+        # Keep a reference so the task's signals outlive the pool run
+        self.parse_task = BookParseTask(text)
+        self.parse_task.signals.parsed.connect(self.on_books_parsed)
+        QThreadPool.globalInstance().start(self.parse_task)
+
+    def on_books_parsed(self, entries):
+        """Start the search worker for the parsed book entries."""
+        self.parse_task = None
+
+        books = self.add_parsed_books(entries)
         if not books:
+            self.search_btn.setEnabled(True)
+            self.search_status.setVisible(False)
             self.debug_callback("No books to search", "info")
             self.show_message("No Books", "Please enter at least one book to search for")
             return
@@ -1500,46 +1742,60 @@ class LibraryAssistantApp(QMainWindow):
         # Clear previous results
         self.clear_results()
 
-        # Create result cards for each book
-        for book in books:
-            self.create_book_card(book)
-
         # Hide empty state label
         self.empty_results_label.hide()
 
-        # Disable search button during search
-        self.search_btn.setEnabled(False)
-        self.search_status.setText("Searching...")
-        self.search_status.setVisible(True)
-
+        # Create the result cards a batch per event-loop pass so the window
+        # keeps painting; the search starts once every card exists
+        self._pending_cards = deque(books)
+        self._pending_search = books
+        self._card_timer.start()
+
+    def _create_card_batch(self):
+        """Create the next batch of result cards, then start the search."""
+        # Suspend repaints so each batch is laid out and painted once
+        self.results_widget.setUpdatesEnabled(False)
+        try:
+            for _ in range(min(CARD_BATCH_SIZE, len(self._pending_cards))):
+                self.create_book_card(self._pending_cards.popleft())
+        finally:
+            self.results_widget.setUpdatesEnabled(True)
+
+        if not self._pending_cards:
+            self._card_timer.stop()
+            books, self._pending_search = self._pending_search, None
+            self.start_search_worker(books)
+
+    def start_search_worker(self, books):
+        """Start the search worker for books that already have cards."""
         self.debug_callback(f"Starting search for {len(books)} books", "info")
 
-        # Start worker thread
-        self.search_thread = QThread()
+        # Create the search worker
         self.search_worker = SearchWorker(books, self.portal, self.username, self.password)
-        self.search_worker.moveToThread(self.search_thread)
 
         # Connect signals
-        self.search_thread.started.connect(self.search_worker.search)
-        self.search_worker.searchStarted.connect(self.on_search_started)
+        self.search_worker.searchStartedBatch.connect(self.on_search_started_batch)
         self.search_worker.searchResult.connect(self.on_search_result)
         self.search_worker.searchError.connect(self.on_search_error)
         self.search_worker.loginRequired.connect(self.on_login_required)
         self.search_worker.finished.connect(self.on_search_finished)
-        self.search_worker.finished.connect(self.search_thread.quit)
-        self.search_thread.finished.connect(self.search_worker.deleteLater)
-        self.search_thread.finished.connect(lambda: setattr(self, 'search_thread', None))
+        self.search_worker.finished.connect(lambda: setattr(self, 'search_worker', None))
 
-        # Start thread
-        self.search_thread.start()
+        # Run on the worker pool
+        self.worker_pool.start(WorkerTask(self.search_worker.search))
 
     def clear_results(self):
         """Clear all results."""
         # Remove all cards
-        while self.results_layout.count() > 1:  # Keep the stretch item
-            item = self.results_layout.takeAt(0)
+        self.book_cards.clear()
+        self.results_widget.setUpdatesEnabled(False)
+        # Take items from the end so the layout never shifts its item list;
+        # the last item is the stretch and is kept
+        for i in range(self.results_layout.count() - 2, -1, -1):
+            item = self.results_layout.takeAt(i)
             if item.widget():
                 item.widget().deleteLater()
+        self.results_widget.setUpdatesEnabled(True)
 
         # Show empty state label
         self.empty_results_label.show()
@@ -1552,24 +1808,29 @@ class LibraryAssistantApp(QMainWindow):
         book_card = BookCard(book)
         book_card.openLinkClicked.connect(self.open_book_link)
         book_card.downloadClicked.connect(self.download_book)
+        self.book_cards[book["id"]] = book_card
 
         # Add to layout before the stretch
         self.results_layout.insertWidget(self.results_layout.count() - 1, book_card)
 
         return book_card
 
+    def on_search_started_batch(self, book_ids):
+        """Handle search started for a batch of books."""
+        for book_id in book_ids:
+            self.on_search_started(book_id)
+
     def on_search_started(self, book_id):
         """Handle search started for a book."""
         if book_id in self.books:
             # Update book status
             self.books[book_id]["status"] = "Searching"
 
-            # Find the card and update it
-            for i in range(self.results_layout.count() - 1):  # Skip the stretch item
-                widget = self.results_layout.itemAt(i).widget()
-                if isinstance(widget, BookCard) and widget.book_info["id"] == book_id:
-                    widget.update_status("Searching")
-                    break
+            # Update the book's card
+            card = self.book_cards.get(book_id)
+            if card is not None:
+                card.update_status("Searching")
+            self._track_downloadable(book_id)
 
     def on_search_result(self, book_id, result):
         """Handle search result for a book."""
@@ -1577,13 +1838,12 @@ class LibraryAssistantApp(QMainWindow):
             # Update book info
             self.books[book_id].update(result)
 
-            # Find the card and update it
-            for i in range(self.results_layout.count() - 1):  # Skip the stretch item
-                widget = self.results_layout.itemAt(i).widget()
-                if isinstance(widget, BookCard) and widget.book_info["id"] == book_id:
-                    widget.update_details(result)
-                    widget.update_status(result.get("status", "Found"))
-                    break
+            # Update the book's card
+            card = self.book_cards.get(book_id)
+            if card is not None:
+                card.update_details(result)
+                card.update_status(result.get("status", "Found"))
+            self._track_downloadable(book_id)
 
             # Enable download all button if any books found
             if result.get("status") == "Found" and result.get("download_url"):
@@ -1595,12 +1855,19 @@ class LibraryAssistantApp(QMainWindow):
             # Update book status
             self.books[book_id]["status"] = "Error"
 
-            # Find the card and update it
-            for i in range(self.results_layout.count() - 1):  # Skip the stretch item
-                widget = self.results_layout.itemAt(i).widget()
-                if isinstance(widget, BookCard) and widget.book_info["id"] == book_id:
-                    widget.update_status("Error", error_message)
-                    break
+            # Update the book's card
+            card = self.book_cards.get(book_id)
+            if card is not None:
+                card.update_status("Error", error_message)
+            self._track_downloadable(book_id)
+
+    def _track_downloadable(self, book_id):
+        """Update the downloadable set after a book's status changed."""
+        book = self.books[book_id]
+        if book.get("status") == "Found" and book.get("download_url"):
+            self._downloadable.add(book_id)
+        else:
+            self._downloadable.discard(book_id)
 
     def on_search_finished(self):
         """Handle search process finished."""
@@ -1639,10 +1906,7 @@ class LibraryAssistantApp(QMainWindow):
     def download_all(self):
         """Download all available books."""
         # Create a dict of all downloadable books
-        download_books = {}
-        for book_id, book in self.books.items():
-            if book.get("status") == "Found" and book.get("download_url"):
-                download_books[book_id] = book
+        download_books = {book_id: self.books[book_id] for book_id in self._downloadable}
 
         if download_books:
             self.start_download(download_books)
@@ -1655,54 +1919,65 @@ class LibraryAssistantApp(QMainWindow):
         # Log what we're downloading
         self.debug_callback(f"Starting download for {len(books_to_download)} books", "info")
 
-        # Start worker thread
-        self.download_thread = QThread()
+        # Create the download worker
         self.download_worker = DownloadWorker(
             books_to_download,
             self.portal,
-            self.settings.get("output_folder"),
+            self.output_folder,
             self.username,
             self.password
         )
-        self.download_worker.moveToThread(self.download_thread)
 
         # Connect signals
-        self.download_thread.started.connect(self.download_worker.download)
-        self.download_worker.downloadStarted.connect(self.on_download_started)
+        self.download_worker.downloadStartedBatch.connect(self.on_download_started_batch)
         self.download_worker.downloadProgress.connect(self.on_download_progress)
         self.download_worker.downloadComplete.connect(self.on_download_complete)
         self.download_worker.downloadError.connect(self.on_download_error)
+        self.download_worker.downloadErrorBatch.connect(self.on_download_error_batch)
         self.download_worker.loginRequired.connect(self.on_login_required)
         self.download_worker.finished.connect(self.on_download_finished)
-        self.download_worker.finished.connect(self.download_thread.quit)
-        self.download_thread.finished.connect(self.download_worker.deleteLater)
-        self.download_thread.finished.connect(lambda: setattr(self, 'download_thread', None))
+        self.download_worker.finished.connect(lambda: setattr(self, 'download_worker', None))
 
-        # Start thread
-        self.download_thread.start()
+        # Run on the worker pool
+        self.worker_pool.start(WorkerTask(self.download_worker.download))
+
+    def on_download_started_batch(self, book_ids):
+        """Handle download started for a batch of books."""
+        for book_id in book_ids:
+            self.on_download_started(book_id)
 
     def on_download_started(self, book_id):
         """Handle download started for a book."""
         if book_id in self.books:
             # Update book status
             self.books[book_id]["status"] = "Downloading"
+            self._shown_progress.pop(book_id, None)
 
-            # Find the card and update status
-            for i in range(self.results_layout.count() - 1):
-                widget = self.results_layout.itemAt(i).widget()
-                if isinstance(widget, BookCard) and widget.book_info["id"] == book_id:
-                    widget.update_status("Downloading")
-                    break
+            # Update the book's card
+            card = self.book_cards.get(book_id)
+            if card is not None:
+                card.update_status("Downloading")
+            self._track_downloadable(book_id)
 
     def on_download_progress(self, book_id, progress):
-        """Handle download progress for a book."""
+        """Queue download progress for a book; cards are updated in batches."""
         if book_id in self.books:
-            # Find the card and update status with progress
-            for i in range(self.results_layout.count() - 1):
-                widget = self.results_layout.itemAt(i).widget()
-                if isinstance(widget, BookCard) and widget.book_info["id"] == book_id:
-                    widget.status_label.setText(f"Downloading: {progress}%")
-                    break
+            self._pending_progress[book_id] = progress
+            if not self._progress_timer.isActive():
+                self._progress_timer.start()
+
+    def _flush_progress(self):
+        """Show the latest queued progress value on each book's card."""
+        pending, self._pending_progress = self._pending_progress, {}
+        for book_id, progress in pending.items():
+            if self._shown_progress.get(book_id) == progress:
+                continue
+
+            # A later status (complete/error) replaces the progress text
+            card = self.book_cards.get(book_id)
+            if card is not None and card.status == "Downloading":
+                card.status_label.setText(f"Downloading: {progress}%")
+                self._shown_progress[book_id] = progress
 
     def on_download_complete(self, book_id, file_path):
         """Handle download completed for a book."""
@@ -1711,28 +1986,31 @@ class LibraryAssistantApp(QMainWindow):
             self.books[book_id]["status"] = "Downloaded"
             self.books[book_id]["local_path"] = file_path
 
-            # Find the card and update status
-            for i in range(self.results_layout.count() - 1):
-                widget = self.results_layout.itemAt(i).widget()
-                if isinstance(widget, BookCard) and widget.book_info["id"] == book_id:
-                    widget.update_status("Downloaded")
-                    break
+            # Update the book's card
+            card = self.book_cards.get(book_id)
+            if card is not None:
+                card.update_status("Downloaded")
+            self._track_downloadable(book_id)
 
             # Show notification
             self.debug_callback(f"Download complete: {file_path}", "info")
 
+    def on_download_error_batch(self, errors):
+        """Handle download errors for a batch of books."""
+        for book_id, error_message in errors:
+            self.on_download_error(book_id, error_message)
+
     def on_download_error(self, book_id, error_message):
         """Handle download error for a book."""
         if book_id in self.books:
             # Update book status
             self.books[book_id]["status"] = "Error"
 
-            # Find the card and update status
-            for i in range(self.results_layout.count() - 1):
-                widget = self.results_layout.itemAt(i).widget()
-                if isinstance(widget, BookCard) and widget.book_info["id"] == book_id:
-                    widget.update_status("Error", error_message)
-                    break
+            # Update the book's card
+            card = self.book_cards.get(book_id)
+            if card is not None:
+                card.update_status("Error", error_message)
+            self._track_downloadable(book_id)
 
             # Log error
             self.debug_callback(f"Download error for book {book_id}: {error_message}", "error")
@@ -1740,40 +2018,35 @@ class LibraryAssistantApp(QMainWindow):
     def on_download_finished(self):
         """Handle download process finished."""
         # Re-enable download button
-        has_downloadable = any(
-            book.get("status") == "Found" and book.get("download_url")
-            for book in self.books.values()
-        )
-        self.download_all_btn.setEnabled(has_downloadable)
+        self.download_all_btn.setEnabled(bool(self._downloadable))
         self.debug_callback("Download worker finished", "info")
 
+    def _dropped_book_file(self, event):
+        """Return the first .txt file path carried by a drag event, or None."""
+        mime_data = event.mimeData()
+        if mime_data.hasUrls():
+            for url in mime_data.urls():
+                file_path = url.toLocalFile()
+                # Only the extension is lowercased, not the whole path
+                if os.path.splitext(file_path)[1].lower() == ".txt":
+                    return file_path
+        return None
+
     def dragEnterEvent(self, event):
         """Handle drag enter events for files."""
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                file_path = url.toLocalFile()
-                if file_path.lower().endswith('.txt'):
-                    event.acceptProposedAction()
-                    return
+        if self._dropped_book_file(event):
+            event.acceptProposedAction()
 
     def dropEvent(self, event):
         """Handle drop events for files."""
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                file_path = url.toLocalFile()
-                if file_path.lower().endswith('.txt'):
-                    try:
-                        # Read file
-                        with open(file_path, 'r', encoding='utf-8') as f:
-                            content = f.read()
-
-                        # Update text input
-                        self.books_input.setText(content)
-                        self.debug_callback(f"Imported book list from dropped file: {file_path}", "info")
-
-                    except Exception as e:
-                        self.logger.error(f"Error importing dropped file: {str(e)}")
-                        self.debug_callback(f"Error importing dropped file: {str(e)}", "error")
-
-                    event.acceptProposedAction()
-                    break
\ No newline at end of file
+        file_path = self._dropped_book_file(event)
+        if file_path:
+            try:
+                # Read file into the text input
+                if self.load_book_file(file_path):
+                    self.debug_callback(f"Imported book list from dropped file: {file_path}", "info")
+
+            except Exception as e:
+                self.logger.error(f"Error importing dropped file: {str(e)}")
+
+            event.acceptProposedAction()
\ No newline at end of file
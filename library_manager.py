@@ -2,34 +2,108 @@
 ProQuest Ebook Central integration module.
 Handles searching and downloading from Ridley library's Ebook Central platform.
 """
+import importlib.util
 import os
 import re
+import shutil
+import tempfile
 import time
 import logging
+import threading
 import requests
 import urllib.parse
 import json
 from typing import Dict, List, Tuple, Optional
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Prefer the C-based lxml parser; fall back to the pure-Python one
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') is not None else 'html.parser'
+
+# Only the parts of each page that are inspected are built into a tree
+FORM_STRAINER = SoupStrainer('form')  # Download page: the format form
+CONFIRM_STRAINER = SoupStrainer(['a', 'form'])  # Confirmation: link or form
+RESULT_LINK_STRAINER = SoupStrainer(['a', 'h3'])  # Search pages: links and titles
+
+# Download and confirmation pages name their form either way; one tree walk finds both
+DOWNLOAD_FORM_SELECTOR = 'form#downloadForm, form[name="downloadForm"]'
+
+# Patterns used while scraping search, detail and download pages
+_DOC_ID_RE = re.compile(r'docID=([^&]+)')
+_DETAIL_DOC_ID_RE = re.compile(r'docID=([^&"\']+)')
+_BOOK_RESULT_ID_RE = re.compile(r'book_results_item_(\d+)')
+_INITIAL_STATE_RE = re.compile(r'window\.__INITIAL_STATE__\s*=\s*({.*?});', re.DOTALL)
+_ANGULAR_BOOKS_RE = re.compile(r'\[books\]="([^"]+)"')
+_PDF_OPTION_RE = re.compile('PDF', re.I)
+
+# Link text that marks the direct download link
+_DOWNLOAD_LINK_RE = re.compile('download|get book|get pdf|get epub', re.I)
+
+# Write buffer for downloaded files; batches chunk writes into few syscalls
+DOWNLOAD_WRITE_BUFFER = 1024 * 1024
+
+# Bytes read from the response per iteration (a few TLS records)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Bytes downloaded between progress callbacks
+PROGRESS_CALLBACK_BYTES = 256 * 1024
+
+# Connections kept open per host; enough for the search (8) and download (4)
+# worker pools to share the session at the same time
+POOL_SIZE = 16
+
+# Page requests use requests' default Accept-Encoding (gzip/deflate, plus br
+# when brotli is installed); PDF/EPUB bodies are already compressed, so the
+# file downloads ask for them as-is
+BINARY_DOWNLOAD_HEADERS = {'Accept-Encoding': 'identity'}
+
+# Rate limiting and transient gateway/server errors retried for idempotent
+# requests (GETs), waiting out any Retry-After; form POSTs are never retried
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Session cookies saved after a login so the next start can skip the login POST
+COOKIE_FILE = os.path.join(os.path.expanduser("~"), ".libbygoget_cookies.json")
+
+# Saved sessions older than this are assumed expired and not probed (seconds)
+COOKIE_MAX_AGE = 8 * 60 * 60
 
 
 class EbookCentralPortal:
     """Class to interact with ProQuest Ebook Central via EZproxy."""
 
-    def __init__(self, username: str = "", password: str = "", debug_callback=None):
+    def __init__(self, username: str = "", password: str = "", debug_callback=None,
+                 debug_dump_pages: bool = False):
         # Hardcoded values for Ridley College
         self.base_url = "https://ebookcentral.proquest.com"
         self.lib_id = "ridley"  # Institution ID in the URL
         self.ezproxy_url = "https://ezproxy.ridley.edu.au/login"
         self.auth_path = "https://ridley.eblib.com/patron/Authentication.aspx?ebcid=966d562a9fb34b42a8930a460c883505&echo=1"
+        # Fixed page URLs, built once
+        self._home_url = f"{self.base_url}/lib/{self.lib_id}/home.action"
+        self._search_action_url = f"{self.base_url}/lib/{self.lib_id}/search.action"
+        self._search_page_url = f"{self.base_url}/ebc/lib/{self.lib_id}/"
+        # Book detail page URL, formatted with a docID
+        self._view_url_tmpl = f"{self.base_url}/lib/{self.lib_id}/detail.action?docID=%s"
 
         # Store debug callback function for UI feedback
         self.debug_callback = debug_callback
+        # Save fetched search pages to the temp directory for inspection
+        self.debug_dump_pages = debug_dump_pages
 
         # Authentication state
         self.username = username
         self.password = password
         self.is_logged_in = False
+        # Serializes logins so parallel workers share a single login round-trip
+        self._login_lock = threading.Lock()
+        # Bumped on every successful login; tells threads whether the session
+        # they sent a request with has since been replaced
+        self._login_generation = 0
+        # Whether the session already holds the home page cookies
+        self._home_cookies_set = False
+        # Saved cookies are only tried on the first login
+        self._saved_cookies_tried = False
 
         # Set up session with headers that mimic a browser
         self.session = requests.Session()
@@ -39,19 +113,51 @@ class EbookCentralPortal:
             'Accept-Language': 'en-US,en;q=0.5',
         })
 
+        # Reuse keep-alive connections across books and worker threads
+        adapter = HTTPAdapter(
+            pool_connections=POOL_SIZE,
+            pool_maxsize=POOL_SIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=RETRY_STATUSES,
+                raise_on_status=False,  # Hand the last response back to the caller
+                # An uncapped Retry-After on a 429/503 would park a pool thread;
+                # use the short backoff instead
+                respect_retry_after_header=False
+            )
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
         # Configure logging
         self.logger = logging.getLogger(__name__)
 
+    def close(self):
+        """Close the session and its pooled connections."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def _debug(self, message, level="info", data=None):
-        """Send debug info to both logger and UI callback if available."""
+        """Send debug info to both logger and UI callback if available.
+
+        The data payload travels with the log record so logging handlers
+        (such as the debug panel) can show it.
+        """
+        extra = {"data": data}
         if level == "info":
-            self.logger.info(message)
+            self.logger.info(message, extra=extra)
         elif level == "error":
-            self.logger.error(message)
+            self.logger.error(message, extra=extra)
         elif level == "debug":
-            self.logger.debug(message)
+            self.logger.debug(message, extra=extra)
         elif level == "warning":
-            self.logger.warning(message)
+            self.logger.warning(message, extra=extra)
 
         # Also send to UI callback if available
         if self.debug_callback:
@@ -76,27 +182,32 @@ class EbookCentralPortal:
         try:
             # Clear any existing cookies
             self.session.cookies.clear()
+            self._home_cookies_set = False
             self._debug("Cleared previous cookies")
 
             # Try to access the homepage without logging in
-            self._debug(f"Testing direct access to: {self.base_url}/lib/{self.lib_id}/home.action")
-            home_response = self.session.get(
-                f"{self.base_url}/lib/{self.lib_id}/home.action",
-                timeout=30,
-                allow_redirects=True
-            )
-
-            result["status_code"] = home_response.status_code
-            result["url"] = home_response.url
-
-            # Check if already logged in directly
-            if "Ebook Central" in home_response.text and "Bookshelf" in home_response.text:
-                result["success"] = True
-                result["message"] = "Already logged in (direct access)"
-                result["is_logged_in"] = True
-                self.is_logged_in = True
-                self._debug("Already logged in (direct access)", "info", result)
-                return result
+            self._debug(f"Testing direct access to: {self._home_url}")
+            if self._home_requires_login():
+                self._debug("Home page redirects to login")
+            else:
+                home_response = self.session.get(
+                    self._home_url,
+                    timeout=30,
+                    allow_redirects=True
+                )
+
+                result["status_code"] = home_response.status_code
+                result["url"] = home_response.url
+
+                # Check if already logged in directly (decode the body once)
+                home_text = home_response.text
+                if "Ebook Central" in home_text and "Bookshelf" in home_text:
+                    result["success"] = True
+                    result["message"] = "Already logged in (direct access)"
+                    result["is_logged_in"] = True
+                    self.is_logged_in = True
+                    self._debug("Already logged in (direct access)", "info", result)
+                    return result
 
             # Try standard login if needed
             self._debug(f"Direct access requires login. Attempting standard login with username: {self.username}")
@@ -121,19 +232,21 @@ class EbookCentralPortal:
             result["url"] = login_response.url
 
             # Save a snippet of the response text for debugging (first 500 chars)
-            response_snippet = login_response.text[:500] + "..." if len(login_response.text) > 500 else login_response.text
+            body = login_response.text
+            response_snippet = body[:500] + "..." if len(body) > 500 else body
             result["response_text"] = response_snippet
 
-            # Check for successful login
-            success_indicators = [
-                "ebookcentral.proquest.com/lib/ridley/home.action" in login_response.url,
-                "Authentication successful" in login_response.text,
-                "My Bookshelf" in login_response.text,
-                "/ebc/" in login_response.url,
-                "ProQuest Ebook Central" in login_response.text and "Bookshelf" in login_response.text
-            ]
+            # Check for successful login; the short URL checks go before the body scans
+            login_url_final = login_response.url
+            logged_in = (
+                "ebookcentral.proquest.com/lib/ridley/home.action" in login_url_final
+                or "/ebc/" in login_url_final
+                or "Authentication successful" in body
+                or "My Bookshelf" in body
+                or ("ProQuest Ebook Central" in body and "Bookshelf" in body)
+            )
 
-            if any(success_indicators):
+            if logged_in:
                 result["success"] = True
                 result["message"] = "Login successful"
                 result["is_logged_in"] = True
@@ -167,18 +280,172 @@ class EbookCentralPortal:
     def login(self) -> bool:
         """Log in to EZproxy and Ebook Central.
 
+        Only one thread logs in at a time; threads that were waiting on
+        another thread's successful login return without a second request.
+
         Returns:
             bool: True if login successful, False otherwise
         """
         try:
-            # Test connection and login in one step
-            result = self.test_connection()
-            return result["success"]
+            with self._login_lock:
+                return self._login_locked()
+
+        except Exception as e:
+            self._debug(f"Login error: {str(e)}", "error")
+            return False
+
+    def _login_locked(self) -> bool:
+        """Log in unless already logged in. Must be called with _login_lock held."""
+        if self.is_logged_in:
+            return True
+
+        # A session saved by an earlier run may still be valid
+        if not self._saved_cookies_tried:
+            self._saved_cookies_tried = True
+            if self._restore_session():
+                self._login_generation += 1
+                return True
+
+        # Test connection and login in one step
+        result = self.test_connection()
+        if result["success"]:
+            self._login_generation += 1
+            self._save_session()
+        return result["success"]
+
+    def _login_again(self, generation: int) -> bool:
+        """Drop an expired login and log in again.
+
+        Threads that saw the same expired session share one new login: only
+        the first to take the lock while the login is still the one their
+        request was sent with logs in; the others reuse its result.
+
+        Args:
+            generation: _login_generation read before the failed request
+
+        Returns:
+            bool: True if the session is logged in again
+        """
+        if not (self.username and self.password):
+            return False
+        try:
+            with self._login_lock:
+                if self._login_generation != generation:
+                    # Another thread already replaced the expired login
+                    return self.is_logged_in
+                self._debug("Session expired, logging in again", "info")
+                self.is_logged_in = False
+                return self._login_locked()
 
         except Exception as e:
             self._debug(f"Login error: {str(e)}", "error")
             return False
 
+    def _home_requires_login(self) -> bool:
+        """Check with a HEAD request whether the home page redirects to a login.
+
+        Only a redirect to a login page is conclusive; any other answer means
+        the caller has to inspect the page itself.
+
+        Returns:
+            bool: True if the session is certainly not logged in
+        """
+        try:
+            head_response = self.session.head(
+                self._home_url,
+                timeout=10,
+                allow_redirects=False
+            )
+        except requests.RequestException:
+            return False
+
+        if not head_response.is_redirect:
+            return False
+        location = head_response.headers.get('Location', '').lower()
+        return 'login' in location or 'ezproxy' in location
+
+    def _restore_session(self) -> bool:
+        """Load saved cookies for the current user and check they still work.
+
+        Returns:
+            bool: True if the saved session is logged in
+        """
+        try:
+            if time.time() - os.path.getmtime(COOKIE_FILE) > COOKIE_MAX_AGE:
+                return False
+            with open(COOKIE_FILE, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        try:
+            if saved.get("username") != self.username:
+                return False
+
+            for cookie in saved.get("cookies", []):
+                self.session.cookies.set(
+                    cookie["name"], cookie["value"],
+                    domain=cookie["domain"], path=cookie["path"],
+                    secure=cookie["secure"], expires=cookie["expires"]
+                )
+        except (KeyError, TypeError, AttributeError, ValueError) as e:
+            # Truncated, old-format or hand-edited file: drop it and log in normally
+            self._debug(f"Ignoring unreadable saved session: {str(e)}", "warning")
+            self.session.cookies.clear()
+            try:
+                os.remove(COOKIE_FILE)
+            except OSError:
+                pass
+            return False
+
+        # One GET settles it: an expired session is redirected to a login
+        # page, a live one lands on the home page
+        self._debug("Checking saved session")
+        try:
+            home_response = self.session.get(self._home_url, timeout=30)
+        except requests.RequestException:
+            return False
+        redirected_to_login = any(
+            'login' in url or 'ezproxy' in url
+            for url in [r.headers.get('Location', '').lower() for r in home_response.history]
+        )
+        home_text = home_response.text
+        if not redirected_to_login and "Ebook Central" in home_text and "Bookshelf" in home_text:
+            self.is_logged_in = True
+            self._home_cookies_set = True
+            self._debug("Saved session is still logged in", "info")
+            return True
+
+        self._debug("Saved session has expired", "info")
+        return False
+
+    def _save_session(self):
+        """Save the session cookies for the current user, readable only by them."""
+        try:
+            saved = {
+                "username": self.username,
+                "cookies": [
+                    {
+                        "name": cookie.name,
+                        "value": cookie.value,
+                        "domain": cookie.domain,
+                        "path": cookie.path,
+                        "secure": cookie.secure,
+                        "expires": cookie.expires
+                    }
+                    for cookie in self.session.cookies
+                ]
+            }
+            fd = os.open(COOKIE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                # O_CREAT's mode only applies to new files; tighten an existing one
+                if hasattr(os, "fchmod"):
+                    os.fchmod(f.fileno(), 0o600)
+                json.dump(saved, f)
+        except Exception as e:
+            # Saving is best-effort; never let it fail a successful login
+            self._debug(f"Could not save session cookies: {str(e)}", "warning")
+
     def search_book(self, title: str, author: str = "") -> Dict:
         """Search for a book using a hybrid approach - session for login and Selenium for dynamic content."""
         try:
@@ -202,13 +469,14 @@ class EbookCentralPortal:
             self._debug(f"Searching for: '{search_query}'", "info")
 
             # First, try the existing API search method
-            # Get home page to establish proper cookies
-            home_url = f"{self.base_url}/lib/{self.lib_id}/home.action"
-            self._debug(f"Getting home page to establish cookies: {home_url}", "info")
-            home_response = self.session.get(home_url, timeout=30)
+            # Get home page to establish proper cookies; once per session is enough
+            if not self._home_cookies_set:
+                self._debug(f"Getting home page to establish cookies: {self._home_url}", "info")
+                self.session.get(self._home_url, timeout=30)
+                self._home_cookies_set = True
 
             # Try a different API endpoint that might return the results directly
-            api_url = f"{self.base_url}/lib/{self.lib_id}/search.action"
+            api_url = self._search_action_url
 
             # Pass the search query as a parameter
             params = {
@@ -219,27 +487,47 @@ class EbookCentralPortal:
             }
 
             self._debug(f"Making direct search request: GET {api_url}", "info")
+            generation = self._login_generation
             search_response = self.session.get(api_url, params=params, timeout=30)
 
+            # A restored or long-lived session can expire mid-run; log in again once
+            if search_response.url.startswith(self.ezproxy_url):
+                if self._login_again(generation):
+                    search_response = self.session.get(api_url, params=params, timeout=30)
+                if search_response.url.startswith(self.ezproxy_url):
+                    # An error, so the login page is never cached as "Not Found"
+                    self._debug("Search was redirected to the login page", "error")
+                    return {
+                        "status": "Error",
+                        "title": title,
+                        "author": author,
+                        "message": "Login required"
+                    }
+
             # Analyze the response
             if search_response.status_code == 200:
                 self._debug(f"Direct search response received (status 200)", "info")
 
-                # Check if we have results by parsing the HTML
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(search_response.text, 'html.parser')
+                # Structured results need no HTML parse; an empty or unexpected
+                # payload falls through to the page scrape below
+                if 'json' in search_response.headers.get('content-type', ''):
+                    try:
+                        json_data = search_response.json()
+                    except ValueError:
+                        json_data = None
+                    if isinstance(json_data, dict) and json_data.get('titles'):
+                        return self._parse_api_search_results(json_data, title, author)
 
-                # Extract all hyperlinks that might contain book data
-                links = soup.find_all('a')
-                book_links = [link for link in links if 'docID=' in link.get('href', '')]
+                # Check if we have results by parsing the HTML
+                soup = BeautifulSoup(search_response.text, HTML_PARSER, parse_only=RESULT_LINK_STRAINER)
 
-                if book_links:
-                    # We found at least one book
-                    first_book = book_links[0]
+                # Find the first hyperlink that carries book data
+                first_book = soup.find('a', href=_DOC_ID_RE)
 
+                if first_book:
                     # Extract book ID from the link
                     href = first_book.get('href', '')
-                    book_id_match = re.search(r'docID=([^&]+)', href)
+                    book_id_match = _DOC_ID_RE.search(href)
                     book_id = book_id_match.group(1) if book_id_match else ''
 
                     # Extract title - might be in the link text or nearby element
@@ -254,7 +542,7 @@ class EbookCentralPortal:
                     author_text = author_element.get_text().strip() if author_element else author
 
                     # Construct URLs
-                    view_url = f"{self.base_url}/lib/{self.lib_id}/detail.action?docID={book_id}" if book_id else ""
+                    view_url = self._view_url_tmpl % book_id if book_id else ""
                     download_url = f"{view_url}&download=true" if book_id else ""
 
                     result = {
@@ -275,11 +563,20 @@ class EbookCentralPortal:
                     # Continue to next approach
 
             # If we didn't find results via direct search, try scraping the search results page
-            search_url = f"{self.base_url}/ebc/lib/{self.lib_id}/?query={search_query}"
-            self._debug(f"Getting search results page: {search_url}", "info")
+            search_url = self._search_page_url
+
+            # Use our authenticated session to get the search page; requests encodes the query
+            page_response = self.session.get(search_url, params={"query": search_query}, timeout=30)
+            self._debug(f"Got search results page: {page_response.url}", "info")
 
-            # Use our authenticated session to get the search page
-            page_response = self.session.get(search_url, timeout=30)
+            if page_response.url.startswith(self.ezproxy_url):
+                self._debug("Search page was redirected to the login page", "error")
+                return {
+                    "status": "Error",
+                    "title": title,
+                    "author": author,
+                    "message": "Login required"
+                }
 
             if page_response.status_code != 200:
                 self._debug(f"Error getting search page: {page_response.status_code}", "error")
@@ -288,14 +585,19 @@ class EbookCentralPortal:
                     "message": f"Failed to get search page: {page_response.status_code}"
                 }
 
-            # Save the HTML for inspection
-            with open("search_page.html", "w", encoding="utf-8") as f:
-                f.write(page_response.text)
-            self._debug("Saved search page HTML for inspection", "info")
+            # Save the HTML for inspection when asked to
+            if self.debug_dump_pages:
+                dump_path = os.path.join(tempfile.gettempdir(), "search_page.html")
+                with open(dump_path, "wb") as f:
+                    f.write(page_response.content)
+                self._debug(f"Saved search page HTML for inspection: {dump_path}", "info")
+
+            # Response.text decodes the body on every access; the page is scanned several times
+            page_text = page_response.text
 
             # Try to extract any book IDs using regex
-            book_id_matches = re.findall(r'book_results_item_(\d+)', page_response.text)
-            detail_matches = re.findall(r'docID=([^&"\']+)', page_response.text)
+            book_id_matches = _BOOK_RESULT_ID_RE.findall(page_text)
+            detail_matches = _DETAIL_DOC_ID_RE.findall(page_text)
 
             if book_id_matches or detail_matches:
                 # We found potential book IDs
@@ -303,7 +605,7 @@ class EbookCentralPortal:
                 self._debug(f"Found potential book IDs via regex: {book_id_matches or detail_matches}", "info")
 
                 # Now parse the HTML to extract details
-                soup = BeautifulSoup(page_response.text, 'html.parser')
+                soup = BeautifulSoup(page_text, HTML_PARSER, parse_only=RESULT_LINK_STRAINER)
 
                 # Look for book title in various elements
                 title_elem = soup.find('h3', class_='title') or soup.find('h3')
@@ -314,7 +616,7 @@ class EbookCentralPortal:
                 author_text = author_elem.get_text().strip() if author_elem else author
 
                 # Construct URLs
-                view_url = f"{self.base_url}/lib/{self.lib_id}/detail.action?docID={book_id}" if book_id else ""
+                view_url = self._view_url_tmpl % book_id if book_id else ""
                 download_url = f"{view_url}&download=true" if book_id else ""
 
                 result = {
@@ -333,8 +635,11 @@ class EbookCentralPortal:
 
             # If we still haven't found results, try one more approach - checking if the search is
             # returning results but they're hidden in JavaScript data
-            script_data_matches = re.findall(r'window\.__INITIAL_STATE__\s*=\s*({.*?});', page_response.text, re.DOTALL)
-            if script_data_matches:
+            # Only the presence of the data matters: locate the marker with a plain
+            # substring search and run the lazy DOTALL pattern from there once
+            state_pos = page_text.find('window.__INITIAL_STATE__')
+            script_data_match = state_pos >= 0 and _INITIAL_STATE_RE.search(page_text, state_pos)
+            if script_data_match:
                 self._debug("Found potential JavaScript data in the page", "info")
 
                 # This would require parsing the JavaScript data, which is complex
@@ -379,9 +684,13 @@ class EbookCentralPortal:
             Dict with search results
         """
         try:
+            # Debug dumps are only built when someone will see them
+            trace = self.debug_callback is not None or self.logger.isEnabledFor(logging.DEBUG)
+
             # Debug the complete structure of the response
-            self._debug("Examining API response structure", "debug",
-                    {"keys": list(json_data.keys() if json_data else [])})
+            if trace:
+                self._debug("Examining API response structure", "debug",
+                        {"keys": list(json_data.keys() if json_data else [])})
 
             # First check if we have any results
             total_count = json_data.get('totalCount', 0)
@@ -402,32 +711,34 @@ class EbookCentralPortal:
             first_result = titles[0]
 
             # Log sample of the data
-            self._debug("First result from API:", "debug", first_result)
+            if trace:
+                self._debug("First result from API:", "debug", first_result)
 
             # Extract book details
-            book_id = str(first_result.get('id', ''))
-            title = first_result.get('title', search_title)
+            get = first_result.get
+            book_id = str(get('id', ''))
+            title = get('title', search_title)
 
             # Handle authors - might be a list or formatted differently
-            authors = first_result.get('authors', [])
+            authors = get('authors', ())
             if isinstance(authors, list):
                 author = '; '.join(authors) if authors else search_author
             else:
                 author = authors or search_author
 
-            publisher = first_result.get('publisher', '')
-            year = str(first_result.get('publicationYear', ''))
+            publisher = get('publisher', '')
+            year = str(get('publicationYear', ''))
 
             # Check if download is available
-            download_available = first_result.get('downloadAvailable', False)
+            download_available = get('downloadAvailable', False)
 
             # Extract additional details if present
-            isbn = first_result.get('isbn', '')
-            eisbn = first_result.get('eisbn', '')
+            isbn = get('isbn', '')
+            eisbn = get('eisbn', '')
 
             # Construct URLs
-            view_url = f"{self.base_url}/lib/{self.lib_id}/detail.action?docID={book_id}"
-            download_url = f"{self.base_url}/lib/{self.lib_id}/detail.action?docID={book_id}&download=true" if download_available else ""
+            view_url = self._view_url_tmpl % book_id
+            download_url = f"{view_url}&download=true" if download_available else ""
 
             result = {
                 "status": "Found",
@@ -469,7 +780,7 @@ class EbookCentralPortal:
             Dict with search results
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, HTML_PARSER)
 
             # Look for book containers with the exact class
             result_containers = soup.select('div.pub-list-item-container')
@@ -486,13 +797,13 @@ class EbookCentralPortal:
                     # Angular might load content dynamically after initial HTML load
 
                 # Check if we can find book IDs with regex
-                book_id_matches = re.findall(r'book_results_item_(\d+)', html_content)
+                book_id_matches = _BOOK_RESULT_ID_RE.findall(html_content)
                 if book_id_matches:
                     self._debug(f"Found book IDs via regex: {book_id_matches}", "info")
                     # We found book IDs but couldn't parse containers - might be due to Angular loading
 
                 # Check for Angular data binding attributes that might contain book info
-                angular_data = re.search(r'\[books\]="([^"]+)"', html_content)
+                angular_data = _ANGULAR_BOOKS_RE.search(html_content)
                 if angular_data:
                     self._debug("Found Angular data binding that might contain book data", "info")
 
@@ -515,7 +826,7 @@ class EbookCentralPortal:
 
             # Get the book ID from the container ID attribute
             container_id = first_container.get('id', '')
-            book_id_match = re.search(r'book_results_item_(\d+)', container_id)
+            book_id_match = _BOOK_RESULT_ID_RE.search(container_id)
             book_id = book_id_match.group(1) if book_id_match else ''
 
             if not book_id:
@@ -563,9 +874,9 @@ class EbookCentralPortal:
             # Construct download URL if download button exists
             download_url = ""
             if has_download:
-                doc_id_match = re.search(r'docID=([^&]+)', view_url)
+                doc_id_match = _DOC_ID_RE.search(view_url)
                 doc_id = doc_id_match.group(1) if doc_id_match else book_id
-                download_url = f"{self.base_url}/lib/{self.lib_id}/detail.action?docID={doc_id}&download=true"
+                download_url = f"{self._view_url_tmpl % doc_id}&download=true"
 
             result = {
                 "status": "Found",
@@ -624,24 +935,32 @@ class EbookCentralPortal:
 
             # Step 1: Visit download page
             self._debug(f"Visiting download page: {download_url}")
-            download_page = self.session.get(download_url, timeout=30)
+            # Streamed, so the with block returns the connection to the pool on every path
+            with self.session.get(download_url, stream=True, timeout=30) as download_page:
+                if download_page.status_code != 200:
+                    error_msg = f"Download page access failed: {download_page.status_code}"
+                    self._debug(error_msg, "error")
+                    return {
+                        "success": False,
+                        "message": error_msg
+                    }
 
-            if download_page.status_code != 200:
-                error_msg = f"Download page access failed: {download_page.status_code}"
-                self._debug(error_msg, "error")
-                return {
-                    "success": False,
-                    "message": error_msg
-                }
+                # The URL may serve the book itself; stream it instead of reading it as a form page
+                page_type = download_page.headers.get('content-type', '').lower()
+                if 'pdf' in page_type or 'epub' in page_type:
+                    self._debug("Download URL serves the file directly")
+                    return self._save_download(download_page, output_path, callback)
+
+                page_text = download_page.text
 
             # Step 2: Find and select format
-            soup = BeautifulSoup(download_page.text, 'html.parser')
+            soup = BeautifulSoup(page_text, HTML_PARSER, parse_only=FORM_STRAINER)
 
             # Look for download options form
-            download_form = soup.find('form', {'id': 'downloadForm'}) or soup.find('form', {'name': 'downloadForm'})
+            download_form = soup.select_one(DOWNLOAD_FORM_SELECTOR)
             if not download_form:
                 self._debug("Could not find download form", "error",
-                        {"page_snippet": download_page.text[:1000]})
+                        {"page_snippet": page_text[:1000]})
                 return {
                     "success": False,
                     "message": "Could not find download form"
@@ -668,7 +987,7 @@ class EbookCentralPortal:
                     # If this is a format selection, prefer PDF
                     if name == 'format':
                         # Check if PDF is available
-                        pdf_option = input_field.find('option', {'value': 'pdf'}) or input_field.find('option', text=re.compile('PDF', re.I))
+                        pdf_option = input_field.find('option', {'value': 'pdf'}) or input_field.find('option', text=_PDF_OPTION_RE)
                         if pdf_option:
                             value = pdf_option.get('value', 'pdf')
                         elif input_field.name == 'select':
@@ -701,15 +1020,14 @@ class EbookCentralPortal:
                 }
 
             # Step 4: Get actual download link from confirmation page
-            confirm_soup = BeautifulSoup(confirm_response.text, 'html.parser')
+            confirm_soup = BeautifulSoup(confirm_response.text, HTML_PARSER, parse_only=CONFIRM_STRAINER)
 
             # Look for download link or form
             download_link = None
 
             # Try finding a direct download link
-            link_elements = confirm_soup.find_all('a')
-            for link in link_elements:
-                if any(term in (link.text.lower() or '') for term in ['download', 'get book', 'get pdf', 'get epub']):
+            for link in confirm_soup.find_all('a'):
+                if _DOWNLOAD_LINK_RE.search(link.get_text()):
                     download_link = link.get('href')
                     if download_link and not download_link.startswith('http'):
                         download_link = urllib.parse.urljoin(confirm_response.url, download_link)
@@ -722,20 +1040,18 @@ class EbookCentralPortal:
 
             # If no direct link, look for a form that submits the download
             if not download_link:
-                download_form = confirm_soup.find('form', {'id': 'downloadForm'}) or confirm_soup.find('form', {'name': 'downloadForm'})
+                download_form = confirm_soup.select_one(DOWNLOAD_FORM_SELECTOR)
                 if download_form:
                     form_action = download_form.get('action', '')
                     if form_action:
                         if not form_action.startswith('http'):
                             form_action = urllib.parse.urljoin(confirm_response.url, form_action)
 
-                        # Prepare form data
-                        final_form_data = {}
-                        for input_field in download_form.find_all('input'):
-                            name = input_field.get('name')
-                            value = input_field.get('value', '')
-                            if name:
-                                final_form_data[name] = value
+                        # Prepare form data from the named inputs
+                        final_form_data = {
+                            input_field['name']: input_field.get('value', '')
+                            for input_field in download_form.select('input[name]')
+                        }
 
                         self._debug(f"Found download form with action: {form_action}")
 
@@ -743,9 +1059,9 @@ class EbookCentralPortal:
                         form_method = download_form.get('method', 'post').lower()
                         self._debug(f"Submitting final download form")
                         if form_method == 'post':
-                            download_response = self.session.post(form_action, data=final_form_data, stream=True, timeout=30)
+                            download_response = self.session.post(form_action, data=final_form_data, stream=True, headers=BINARY_DOWNLOAD_HEADERS, timeout=30)
                         else:
-                            download_response = self.session.get(form_action, params=final_form_data, stream=True, timeout=30)
+                            download_response = self.session.get(form_action, params=final_form_data, stream=True, headers=BINARY_DOWNLOAD_HEADERS, timeout=30)
                     else:
                         error_msg = "Could not find download action"
                         self._debug(error_msg, "error")
@@ -764,67 +1080,107 @@ class EbookCentralPortal:
             else:
                 # Use the direct download link
                 self._debug(f"Starting download from direct link")
-                download_response = self.session.get(download_link, stream=True, timeout=30)
+                download_response = self.session.get(download_link, stream=True, headers=BINARY_DOWNLOAD_HEADERS, timeout=30)
 
-            # Check if download succeeded
-            if download_response.status_code != 200:
-                error_msg = f"File download failed: {download_response.status_code}"
-                self._debug(error_msg, "error")
-                return {
-                    "success": False,
-                    "message": error_msg
-                }
+            with download_response:
+                # Check if download succeeded
+                if download_response.status_code != 200:
+                    error_msg = f"File download failed: {download_response.status_code}"
+                    self._debug(error_msg, "error")
+                    return {
+                        "success": False,
+                        "message": error_msg
+                    }
 
-            # Determine file extension from content-type
-            content_type = download_response.headers.get('content-type', '').lower()
-            self._debug(f"Download content type: {content_type}")
+                return self._save_download(download_response, output_path, callback)
 
-            ext = '.pdf' if 'pdf' in content_type else '.epub' if 'epub' in content_type else '.bin'
+        except requests.Timeout:
+            error_msg = "Download timed out"
+            self._debug(error_msg, "error")
+            return {
+                "success": False,
+                "message": error_msg
+            }
+        except Exception as e:
+            error_msg = f"Download error: {str(e)}"
+            self._debug(error_msg, "error")
+            return {
+                "success": False,
+                "message": str(e)
+            }
+
+    def _save_download(self, download_response, output_path: str, callback=None) -> Dict:
+        """Stream a book file response to disk.
+
+        Args:
+            download_response: Streamed response carrying the book file
+            output_path: Path to save the file; the extension follows the content type
+            callback: Optional callback function for progress updates
+
+        Returns:
+            Dict with results
+        """
+        # Determine file extension from content-type
+        content_type = download_response.headers.get('content-type', '').lower()
+        self._debug(f"Download content type: {content_type}")
+
+        ext = '.pdf' if 'pdf' in content_type else '.epub' if 'epub' in content_type else '.bin'
+
+        # If output_path doesn't have the right extension, add it
+        if not output_path.lower().endswith(ext):
+            output_path = f"{os.path.splitext(output_path)[0]}{ext}"
 
-            # If output_path doesn't have the right extension, add it
-            if not output_path.lower().endswith(ext):
-                output_path = f"{os.path.splitext(output_path)[0]}{ext}"
+        self._debug(f"Saving download to: {output_path}")
 
-            self._debug(f"Saving download to: {output_path}")
+        # Ensure output directory exists
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
-            # Ensure output directory exists
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        # Save the file
+        total_length = int(download_response.headers.get('content-length', 0))
+        downloaded = 0
 
-            # Save the file
-            total_length = int(download_response.headers.get('content-length', 0))
-            downloaded = 0
+        self._debug(f"Total download size: {total_length} bytes")
 
-            self._debug(f"Total download size: {total_length} bytes")
+        report_progress = callback is not None and total_length > 0
+        last_reported = 0
 
-            with open(output_path, 'wb') as f:
-                for chunk in download_response.iter_content(chunk_size=8192):
+        with open(output_path, 'wb', buffering=DOWNLOAD_WRITE_BUFFER) as f:
+            # Reserve the whole file up front so it is laid out in few extents
+            preallocated = total_length > 0 and hasattr(os, 'posix_fallocate')
+            if preallocated:
+                try:
+                    os.posix_fallocate(f.fileno(), 0, total_length)
+                except OSError:
+                    preallocated = False  # Not supported by this filesystem
+
+            if report_progress:
+                for chunk in download_response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
                     if chunk:
                         f.write(chunk)
                         downloaded += len(chunk)
 
-                        # Update progress if callback provided
-                        if callback and total_length:
+                        # Update progress every few chunks
+                        if downloaded - last_reported >= PROGRESS_CALLBACK_BYTES:
                             callback(downloaded, total_length)
+                            last_reported = downloaded
+            else:
+                # Nothing to report per chunk: let shutil copy the raw stream
+                download_response.raw.decode_content = True
+                shutil.copyfileobj(download_response.raw, f, DOWNLOAD_WRITE_BUFFER)
+                downloaded = f.tell()
 
-            self._debug(f"Download complete: {downloaded} bytes saved")
+            # Drop any reserved space a short transfer did not fill
+            if preallocated:
+                f.truncate()
 
-            return {
-                "success": True,
-                "file_path": output_path,
-                "format": ext[1:].upper()  # Remove leading dot
-            }
+        # Always report the final position
+        if report_progress and last_reported != downloaded:
+            callback(downloaded, total_length)
 
-        except requests.Timeout:
-            error_msg = "Download timed out"
-            self._debug(error_msg, "error")
-            return {
-                "success": False,
-                "message": error_msg
-            }
-        except Exception as e:
-            error_msg = f"Download error: {str(e)}"
-            self._debug(error_msg, "error")
-            return {
-                "success": False,
-                "message": str(e)
-            }
\ No newline at end of file
+        self._debug(f"Download complete: {downloaded} bytes saved")
+
+        return {
+            "success": True,
+            "file_path": output_path,
+            "format": ext[1:].upper()  # Remove leading dot
+        }
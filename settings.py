@@ -6,6 +6,11 @@ import json
 import logging
 from pathlib import Path
 
+import keyring
+
+# Service name used for credentials stored in the system keyring
+KEYRING_SERVICE = "LibraryAssistant"
+
 
 class Settings:
     """Class to manage application settings."""
@@ -13,6 +18,8 @@ class Settings:
     def __init__(self, filename="library_settings.json"):
         self.filename = filename
         self.settings = self._load()
+        self._dirty = False  # In-memory settings differ from the file
+        self._credential_cache = {}  # Keyring values already fetched
         
     def _load(self):
         """Load settings from file."""
@@ -35,14 +42,22 @@ class Settings:
             "output_folder": downloads_dir,
             "remember_credentials": True,
             "last_file_path": os.path.expanduser("~"),
-            "download_format_preference": "pdf"  # Default format preference
+            "download_format_preference": "pdf",  # Default format preference
+            "use_native_dialogs": True  # False uses Qt's own file dialogs
         }
     
     def save(self):
-        """Save settings to file."""
+        """Save settings to file if anything changed since the last save."""
+        if not self._dirty and os.path.exists(self.filename):
+            return
         try:
-            with open(self.filename, 'w') as f:
+            # Write a temporary file and swap it in, so a crash mid-write
+            # never leaves a truncated settings file behind
+            tmp_filename = self.filename + ".tmp"
+            with open(tmp_filename, 'w') as f:
                 json.dump(self.settings, f, indent=4)
+            os.replace(tmp_filename, self.filename)
+            self._dirty = False
         except Exception as e:
             logging.error(f"Error saving settings: {str(e)}")
     
@@ -52,4 +67,22 @@ class Settings:
     
     def set(self, key, value):
         """Set a setting value."""
-        self.settings[key] = value
+        if key not in self.settings or self.settings[key] != value:
+            self.settings[key] = value
+            self._dirty = True
+
+    def get_credential(self, key):
+        """Get a credential from the keyring, cached after the first read."""
+        if key not in self._credential_cache:
+            self._credential_cache[key] = keyring.get_password(KEYRING_SERVICE, key) or ""
+        return self._credential_cache[key]
+
+    def set_credential(self, key, value):
+        """Store a credential in the keyring and the cache.
+
+        Unchanged values are not written, avoiding a keyring round-trip.
+        """
+        if self._credential_cache.get(key) == value:
+            return
+        keyring.set_password(KEYRING_SERVICE, key, value)
+        self._credential_cache[key] = value
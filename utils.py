@@ -3,27 +3,42 @@ Utility functions for Library Assistant.
 """
 import os
 import re
+import queue
+import atexit
 import logging
+import logging.handlers
 import hashlib
 from pathlib import Path
 from datetime import datetime
 
 
+# Background thread that writes queued log records to the console and log file
+_log_listener = None
+
+
 def setup_logging(log_level=logging.INFO):
     """Set up logging configuration.
 
+    Records are handed to a queue and written by a background listener, so
+    logging calls on the GUI and worker threads never wait on console or
+    disk I/O.
+
     Args:
         log_level: Logging level (default: INFO)
 
     Returns:
         Configured logger instance
     """
+    global _log_listener
+
     logger = logging.getLogger()
     logger.setLevel(log_level)
 
     # Remove any existing handlers
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
+    if _log_listener is not None:
+        _log_listener.stop()
 
     # Create console handler
     console_handler = logging.StreamHandler()
@@ -33,8 +48,7 @@ def setup_logging(log_level=logging.INFO):
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
     console_handler.setFormatter(formatter)
 
-    # Add console handler to logger
-    logger.addHandler(console_handler)
+    output_handlers = [console_handler]
 
     # Create file handler in logs directory
     try:
@@ -49,14 +63,48 @@ def setup_logging(log_level=logging.INFO):
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
 
-        # Add file handler to logger
-        logger.addHandler(file_handler)
+        output_handlers.append(file_handler)
+        file_error = None
     except Exception as e:
-        logger.warning(f"Could not set up file logging: {str(e)}")
+        file_error = e
+
+    # Route records through a queue to the output handlers
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(log_queue, *output_handlers,
+                                                   respect_handler_level=True)
+    _log_listener.start()
+    if file_error is not None:
+        logger.warning(f"Could not set up file logging: {str(file_error)}")
 
     return logger
 
 
+@atexit.register
+def _stop_log_listener():
+    """Flush queued log records on exit."""
+    if _log_listener is not None:
+        _log_listener.stop()
+
+
+# Whitespace runs, and whitespace next to QSS punctuation
+_QSS_SPACE_RE = re.compile(r'\s+')
+_QSS_PUNCT_SPACE_RE = re.compile(r'\s*([{};:,])\s*')
+
+
+def compact_qss(qss):
+    """Strip redundant whitespace from a Qt stylesheet.
+
+    Args:
+        qss: Stylesheet text
+
+    Returns:
+        Equivalent stylesheet without indentation or line breaks
+    """
+    qss = _QSS_SPACE_RE.sub(' ', qss)
+    return _QSS_PUNCT_SPACE_RE.sub(r'\1', qss).strip()
+
+
 def generate_book_id(title, author):
     """Generate a unique ID for a book based on title and author.
 
@@ -67,15 +115,18 @@ def generate_book_id(title, author):
     Returns:
         Unique identifier string
     """
-    # Create a hash from the title and author
+    # Create a hash from the title and author; a 5-byte digest gives the 10 hex chars directly
     text = f"{title.lower().strip()}|{author.lower().strip()}"
-    hash_obj = hashlib.md5(text.encode())
-    hash_str = hash_obj.hexdigest()[:10]
+    hash_str = hashlib.blake2b(text.encode(), digest_size=5).hexdigest()
 
     # Return a prefixed ID
     return f"book_{hash_str}"
 
 
+# Characters that are invalid in filenames on common filesystems
+_FNAME_TRANS = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+
 def clean_filename(filename):
     """Clean a filename to make it safe for all filesystems.
 
@@ -85,10 +136,8 @@ def clean_filename(filename):
     Returns:
         Cleaned filename
     """
-    # Replace invalid chars with underscores
-    invalid_chars = r'<>:"/\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
+    # Replace invalid chars with underscores in one pass
+    filename = filename.translate(_FNAME_TRANS)
 
     # Limit length (255 is safe for most filesystems)
     if len(filename) > 200:
@@ -105,6 +154,11 @@ def clean_filename(filename):
     return filename
 
 
+# Book list line formats: "Title by Author" and "Author - Title"
+_BY_LINE_RE = re.compile(r'(.*?)\s+by\s+(.*)', re.IGNORECASE)
+_DASH_LINE_RE = re.compile(r'(.*?)\s+-\s+(.*)')
+
+
 def parse_book_list(text):
     """Parse a list of books from text input.
 
@@ -121,14 +175,13 @@ def parse_book_list(text):
     """
     books = []
 
-    lines = text.strip().split('\n')
-    for line in lines:
+    for line in text.splitlines():
         line = line.strip()
         if not line:
             continue
 
-        # Try "Title by Author" format
-        by_match = re.search(r'(.*?)\s+by\s+(.*)', line, re.IGNORECASE)
+        # Try "Title by Author" format; the substring test skips the regex on most lines
+        by_match = 'by' in line.lower() and _BY_LINE_RE.match(line)
         if by_match:
             title = by_match.group(1).strip()
             author = by_match.group(2).strip()
@@ -140,7 +193,7 @@ def parse_book_list(text):
             continue
 
         # Try "Author - Title" format
-        dash_match = re.search(r'(.*?)\s+-\s+(.*)', line)
+        dash_match = '-' in line and _DASH_LINE_RE.match(line)
         if dash_match:
             # Check if first part looks like a name (shorter, has fewer words)
             part1 = dash_match.group(1).strip()